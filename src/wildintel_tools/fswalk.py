@@ -0,0 +1,108 @@
+"""
+Directory traversal helpers built on :func:`os.scandir`.
+
+The entries returned by ``os.scandir`` already know whether they are files or
+directories, so walking a tree with them avoids the extra ``stat`` per path that
+``Path.iterdir``/``Path.rglob`` followed by ``is_dir``/``is_file`` costs. On the image
+trees handled by the collection operations that is most of the time spent listing.
+"""
+import os
+from pathlib import Path
+from typing import Iterator
+
+
+def list_subdirs(path: Path) -> list[Path]:
+    """
+    List the directories directly under *path*.
+
+    :param path: Directory to list.
+    :type path: Path
+    :return: The subdirectories, in directory order.
+    :rtype: list[Path]
+    """
+    with os.scandir(path) as it:
+        return [Path(e.path) for e in it if e.is_dir()]
+
+
+def iter_files(root: Path, valid_exts: frozenset[str]) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield the files under *root* whose lowercase extension is in *valid_exts*.
+
+    The tree is walked with an explicit stack. Symlinked directories are not followed.
+
+    :param root: Directory to walk.
+    :type root: Path
+    :param valid_exts: Accepted extensions, lowercase and including the leading dot.
+    :type valid_exts: frozenset[str]
+    :return: An iterator over the matching directory entries.
+    :rtype: Iterator[os.DirEntry]
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    # Same result as os.path.splitext for the names that matter, without its overhead
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot > 0 and name[dot:].lower() in valid_exts and entry.is_file():
+                        yield entry
+
+
+def walk(root: Path) -> tuple[list[Path], list[Path]]:
+    """
+    List every directory and file under *root*, recursively.
+
+    Symlinked directories are not followed.
+
+    :param root: Directory to walk.
+    :type root: Path
+    :return: ``(directories, files)``, parents listed before their children.
+    :rtype: tuple[list[Path], list[Path]]
+    """
+    dirs: list[Path] = []
+    files: list[Path] = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(Path(entry.path))
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    files.append(Path(entry.path))
+    return dirs, files
+
+
+class FsIndex:
+    """
+    Memoized :func:`iter_files` listings, shared by several operations over the same tree.
+
+    Commands that check and then prepare the same deployments (e.g. the ``pipeline``
+    command) list each deployment once instead of once per step. The listings are a
+    snapshot: use a new index once files may have been added or removed.
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[tuple[str, frozenset[str]], list[os.DirEntry]] = {}
+
+    def files(self, root: Path, valid_exts: frozenset[str]) -> list[os.DirEntry]:
+        """
+        Return the files under *root* whose lowercase extension is in *valid_exts*.
+
+        The tree is only walked the first time a ``(root, valid_exts)`` pair is requested.
+
+        :param root: Directory to walk.
+        :type root: Path
+        :param valid_exts: Accepted extensions, lowercase and including the leading dot.
+        :type valid_exts: frozenset[str]
+        :return: The matching directory entries, in :func:`iter_files` order.
+        :rtype: list[os.DirEntry]
+        """
+        key = (os.fspath(root), valid_exts)
+        entries = self._files.get(key)
+        if entries is None:
+            entries = self._files[key] = list(iter_files(root, valid_exts))
+        return entries
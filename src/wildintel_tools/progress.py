@@ -0,0 +1,116 @@
+"""
+Progress events emitted by the long-running collection operations.
+
+Functions such as :func:`wildintel_tools.wildintel.check_deployments` or
+:meth:`wildintel_tools.trapper_package.DataPackageGeneratorParallel.run` accept an
+optional ``progress_callback``. It is called with an event code followed by the
+collection name, the deployment name (``None`` for collection-level events) and a count:
+
+.. code-block:: python
+
+    def on_progress(event: ProgressEvent, col: str | None, dep: str | None, count: int) -> None:
+        if event == ProgressEvent.FILE_PROGRESS:
+            ...
+
+The values are passed already split, so callbacks never build or parse strings on
+the per-file hot path. :func:`wildintel_tools.wildintel.import_deployment` follows
+the same convention with :class:`ImportEvent`, passing the file name instead of the
+collection and deployment.
+"""
+import time
+from enum import IntEnum
+from typing import Callable, Optional
+
+
+class ProgressEvent(IntEnum):
+    """
+    Kind of progress notification.
+
+    - ``COLLECTION_START``: a collection begins; ``count`` is its number of deployments.
+    - ``DEPLOYMENT_START``: a deployment begins; ``count`` is its number of work units (files or bytes).
+    - ``FILE_PROGRESS``: ``count`` work units of a deployment were processed.
+    - ``DEPLOYMENT_COMPLETE``: a deployment finished.
+    - ``DEPLOYMENT_ERROR``: a deployment failed and was skipped.
+    - ``COLLECTION_DONE``: a collection finished.
+    - ``FINISHED``: the whole operation finished.
+    """
+
+    COLLECTION_START = 0
+    DEPLOYMENT_START = 1
+    FILE_PROGRESS = 2
+    DEPLOYMENT_COMPLETE = 3
+    DEPLOYMENT_ERROR = 4
+    COLLECTION_DONE = 5
+    FINISHED = 6
+
+
+ProgressCallback = Callable[[ProgressEvent, Optional[str], Optional[str], int], None]
+
+
+class FileProgress:
+    """
+    Coalesce the ``FILE_PROGRESS`` events of one deployment.
+
+    Units are accumulated and reported in a single event once ``max_pending`` are pending
+    or ``interval`` seconds have passed since the last one, so the callback runs a few
+    times per second however fast the files are processed. :meth:`flush` reports the
+    rest and must be called before ``DEPLOYMENT_COMPLETE``.
+
+    :param callback: Callback to report to, or ``None`` to report nothing.
+    :param col_name: Collection of the deployment.
+    :param dep_name: Deployment name.
+    :param max_pending: Pending units that trigger an event.
+    :param interval: Maximum seconds between events while units are pending.
+    """
+
+    __slots__ = ("_callback", "_col_name", "_dep_name", "_max_pending", "_interval", "_pending", "_last")
+
+    def __init__(
+        self,
+        callback: Optional[ProgressCallback],
+        col_name: str,
+        dep_name: str,
+        max_pending: int = 64,
+        interval: float = 0.1,
+    ) -> None:
+        self._callback = callback
+        self._col_name = col_name
+        self._dep_name = dep_name
+        self._max_pending = max_pending
+        self._interval = interval
+        self._pending = 0
+        self._last = time.monotonic()
+
+    def advance(self, count: int = 1) -> None:
+        if self._callback is None:
+            return
+        self._pending += count
+        if self._pending >= self._max_pending or time.monotonic() - self._last >= self._interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._callback(ProgressEvent.FILE_PROGRESS, self._col_name, self._dep_name, self._pending)
+            self._pending = 0
+        self._last = time.monotonic()
+
+
+class ImportEvent(IntEnum):
+    """
+    Kind of progress notification emitted while importing a deployment.
+
+    - ``COPY_START``: the copy phase begins; ``count`` is the number of files to copy.
+    - ``COPY_FILE``: one file was copied.
+    - ``EXIF_START``: the timestamp phase begins; ``count`` is the number of media files to scan.
+    - ``EXIF_FILE``: the timestamp of one file was read.
+    - ``EXIF_SKIP``: one file was skipped because it has no readable timestamp.
+    """
+
+    COPY_START = 0
+    COPY_FILE = 1
+    EXIF_START = 2
+    EXIF_FILE = 3
+    EXIF_SKIP = 4
+
+
+ImportProgressCallback = Callable[[ImportEvent, Optional[str], int], None]
@@ -17,39 +17,43 @@ import json
 import yaml
 from wildintel_tools.ui.typer.i18n import _
 
+def _convert_paths(obj):
+    """Replaces the :class:`Path` objects nested in dicts and lists by strings, which YAML can dump safely."""
+    if isinstance(obj, dict):
+        return {k: _convert_paths(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_convert_paths(v) for v in obj]
+    elif isinstance(obj, Path):
+        return str(obj)
+    else:
+        return obj
+
 class ReportWriter:
     """
     Utility class to export Report instances to YAML files.
     """
 
     @staticmethod
-    def to_yaml(report: "Report", path: Path) -> str:
+    def to_yaml(report: "Report", path: Path) -> str | None:
         """
         Writes the given Report instance to a YAML file.
 
+        The YAML is streamed to the file through a large buffer instead of being built
+        as a string first.
+
         :param report: The Report object to serialize.
-        :param path: Destination path for the YAML file.
+        :param path: Destination path for the YAML file, or ``None`` to get the YAML as a string.
+        :return: The YAML string if ``path`` is ``None``, otherwise ``None``.
         """
-
-        def convert_paths(obj):
-            if isinstance(obj, dict):
-                return {k: convert_paths(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_paths(v) for v in obj]
-            elif isinstance(obj, Path):
-                return str(obj)
-            else:
-                return obj
-
         data = asdict(report)
-        data = convert_paths(data)
-        yaml_str = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+        data = _convert_paths(data)
 
-        if path is not None:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(yaml_str)
+        if path is None:
+            return yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
 
-        return yaml_str
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        return None
 
 class ReportReader:
     """
@@ -69,6 +73,29 @@ class ReportReader:
 
         return Report(**data)
 
+    @classmethod
+    def from_autosave(cls, path: Path) -> "Report":
+        """
+        Rebuilds a Report instance from its autosave journal, e.g. after an interrupted run.
+
+        :param path: Path to the autosave file written by :class:`Report`.
+        :return: A Report instance with the header and every entry recorded in the journal.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            documents = [doc for doc in yaml.safe_load_all(f) if doc]
+
+        report = Report(autosave_path=Path(path), **documents[0])
+        # New entries are appended after the recovered ones
+        report._journal_started = True
+        for doc in documents[1:]:
+            if "end_time" in doc:
+                report.end_time = doc["end_time"]
+                continue
+            bucket = report.errors if "error" in doc else report.successes
+            identifier, entry = next(iter((doc.get("error") or doc["success"]).items()))
+            bucket.setdefault(identifier, []).append(entry)
+        return report
+
 class ReportStatus(str, Enum):
     """
     Enumeration of possible states of a report.
@@ -97,6 +124,11 @@ class Report:
     with associated successes or errors. The report tracks all these events,
     computes an overall status, and can export/import its contents as YAML.
 
+    Until the report is saved with :meth:`to_yaml`, every entry is also appended to
+    ``autosave_path`` as a YAML document of its own, so a run that is interrupted
+    leaves its results on disk (see :meth:`ReportReader.from_autosave`). Appending
+    costs the same however many entries the report already has.
+
     :ivar title: Descriptive title of the report.
     :vartype title: str
     :ivar start_time: Time when the report was created or started.
@@ -119,10 +151,12 @@ class Report:
 
     def __post_init__(self):
         if self.autosave_path is None:
-            # Crear fichero temporal
-            tmp = tempfile.NamedTemporaryFile(delete=False, prefix="report_", suffix=".yaml")
-            self.autosave_path = Path(tmp.name)
-            tmp.close()  # Cerramos el handle, solo queremos la ruta
+            # Crear fichero temporal; solo queremos la ruta, así que cerramos el descriptor
+            fd, tmp_name = tempfile.mkstemp(prefix="report_", suffix=".yaml")
+            os.close(fd)
+            self.autosave_path = Path(tmp_name)
+        # The header document is written with the first entry
+        self._journal_started = False
 
     def add_error(self, identifier: str, action: str, message: str, **extra: Any) -> None:
         """
@@ -139,7 +173,7 @@ class Report:
         """
         entry = {"action": action, "message": message, **extra}
         self.errors.setdefault(identifier, []).append(entry)
-        self._autosave()
+        self._autosave({"error": {identifier: entry}})
 
     def add_success(self, identifier: str, action: str, message: str = None, **extra: Any) -> None:
         """
@@ -156,12 +190,12 @@ class Report:
         """
         entry = {"action": action, "message": message, **extra}
         self.successes.setdefault(identifier, []).append(entry)
-        self._autosave()
+        self._autosave({"success": {identifier: entry}})
 
     def finish(self) -> None:
         """Marks the report as finished by setting the end time."""
         self.end_time = datetime.now()
-        self._autosave()
+        self._autosave({"end_time": self.end_time})
 
     def get_status(self) -> ReportStatus:
         """
@@ -299,15 +333,15 @@ class Report:
         """
         return ReportReader.from_yaml(filepath)
 
-    def to_yaml(self, filepath: Path | None = None) -> str:
+    def to_yaml(self, filepath: Path | None = None) -> str | None:
         """
-        Converts the current report to a YAML string and optionally saves it to a file.
+        Converts the current report to a YAML string or saves it to a file.
 
-        :param filepath: If provided, the YAML will also be written to this file
-            using UTF-8 encoding. If ``None``, only the string is returned.
+        :param filepath: If provided, the YAML is streamed to this file using UTF-8
+            encoding. If ``None``, the string is returned.
         :type filepath: Optional[Path]
-        :return: The YAML representation of the report.
-        :rtype: str
+        :return: The YAML representation of the report, or ``None`` if it was written to ``filepath``.
+        :rtype: str | None
 
         .. note::
            - Uses :func:`dataclasses.asdict` for serialization.
@@ -365,6 +399,48 @@ class Report:
         if other.end_time and (self.end_time is None or other.end_time > self.end_time):
             self.end_time = other.end_time
 
-    def _autosave(self) -> None:
-        if self.autosave_path:
-            self.to_yaml(self.autosave_path)
\ No newline at end of file
+    def _autosave(self, document: Dict[str, Any]) -> None:
+        if not self.autosave_path:
+            return
+        document = _convert_paths(document)
+        # The first document truncates whatever the file held before
+        with open(self.autosave_path, "a" if self._journal_started else "w", encoding="utf-8") as f:
+            if not self._journal_started:
+                header = {"title": self.title, "type": self.type, "start_time": self.start_time}
+                yaml.safe_dump(header, f, sort_keys=False, allow_unicode=True, explicit_start=True)
+                self._journal_started = True
+            yaml.safe_dump(document, f, sort_keys=False, allow_unicode=True, explicit_start=True)
+
+
+
+@dataclass()
+class ReportBuffer:
+    """
+    Records report entries to add them to a :class:`Report` later, in the same order.
+
+    Lets worker threads record their results without sharing the report, which
+    journals every addition to its autosave file; the owner of the report applies the buffers from
+    a single thread with :meth:`apply`.
+
+    :ivar entries: Pending entries, as ``(add_method, identifier, action, message, extra)``.
+    :vartype entries: List[tuple]
+    """
+    entries: List[tuple] = field(default_factory=list)
+
+    def add_error(self, identifier: str, action: str, message: str, **extra: Any) -> None:
+        """Records an error entry, see :meth:`Report.add_error`."""
+        self.entries.append((Report.add_error, identifier, action, message, extra))
+
+    def add_success(self, identifier: str, action: str, message: str = None, **extra: Any) -> None:
+        """Records a success entry, see :meth:`Report.add_success`."""
+        self.entries.append((Report.add_success, identifier, action, message, extra))
+
+    def apply(self, report: Report) -> None:
+        """
+        Adds the recorded entries to a report.
+
+        :param report: The report to add the entries to.
+        :type report: Report
+        """
+        for add, identifier, action, message, extra in self.entries:
+            add(report, identifier, action, message, **extra)
@@ -1,57 +1,73 @@
 import hashlib
 import io
+import logging
 import os
-import string
+import struct
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
-from enum import unique, Enum
+from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import BinaryIO, Iterator, List, Dict, Optional, Union
 from zoneinfo import ZoneInfo
 from datetime import timezone as datetime_timezone
 
 import exiftool
+from blake3 import blake3
 import filetype
-from PIL import Image, ExifTags
-
-@unique
-class ResourceMymeTypeDTO(Enum):
-    image_png = "image/png"
-    image_jpeg = "image/jpeg"
-    image_gig = "image/gif"
-    image_webp = "image/webp"
-    video_mp4 = "video/mp4"
-    video_mpeg = "video/mpeg"
-    video_quicktime = "video/quicktime"
-    video_x_msvideo = "video/x-msvideo"
-
-    def __str__(self):
-        return self.value
-
-@unique
-class ResourceExtensionDTO(Enum):
-    png = ".png"
-    jpg = ".jpg"
-    jpeg = ".jpeg"
-    gif = ".gif"
-    webp = ".webp"
-    mp4 = ".mp4"
-    mpeg = ".mpeg"
-    mov = ".mov"
-    avi = ".avi"
-
-    def __str__(self):
-        return self.value
-
-class ResourceEntityDTO():
+import PIL
+from PIL import Image, ExifTags, features
+
+# Re-exported: the enums live in a module of their own so the CLI can use them without loading Pillow
+from wildintel_tools.resourcetypes import ResourceExtensionDTO, ResourceMymeTypeDTO
+
+__all__ = ["ResourceEntityDTO", "ResourceExtensionDTO", "ResourceMymeTypeDTO", "ResourceUtils"]
+
+logger = logging.getLogger(__name__)
+
+# EXIF tag name -> tag id
+_EXIF_TAG_IDS = {name: tag_id for tag_id, name in ExifTags.TAGS.items()}
+
+_sha1 = partial(hashlib.sha1, usedforsecurity=False)
+# Large inputs are split over Rayon threads; small ones stay on the calling thread
+_blake3 = partial(blake3, max_threads=blake3.AUTO)
+# hashlib.sha1 is OpenSSL's (module "_hashlib") unless CPython was built without it, in which
+# case the much slower builtin implementation without SHA extensions is used
+logger.debug("SHA-1 implementation: %s", getattr(hashlib.sha1, "__module__", None) or "unknown")
+# Pillow-SIMD reports a ".postN" version; libjpeg-turbo gives SIMD JPEG decoding and encoding
+logger.debug("Pillow %s, libjpeg-turbo: %s", PIL.__version__, features.check_feature("libjpeg_turbo"))
+
+# File signatures recognized without filetype, with the MIME type filetype reports for them
+_MAGIC_PREFIXES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+# RIFF containers, by the form type at bytes 8-12
+_RIFF_MIME_TYPES = {
+    b"WEBP": "image/webp",
+    b"AVI ": "video/x-msvideo",
+}
+
+
+@lru_cache(maxsize=None)
+def _enum_values(enum_cls: type[Enum]) -> frozenset:
+    """Values of an Enum class, computed once per class."""
+    return frozenset(member.value for member in enum_cls)
+
+
+@dataclass(slots=True, kw_only=True)
+class ResourceEntityDTO:
     contenthash : str
     pathnamehash : str
     filesize : int
     mimetype : ResourceMymeTypeDTO
     filename: str
-    content: bytes
     recordered_at: datetime
-    deployment_id: string
+    deployment_id: str
     sortorder: int | None = None
     content: bytes | None = None
 
@@ -71,36 +87,172 @@ class ResourceUtils:
         "Model",
     ]
 
+    # Rows per strip when hashing pixel data (about 1.8 MB for a 6000 px wide RGB image)
+    PIXEL_HASH_STRIP_ROWS = 100
+
     @staticmethod
-    def calculate_hash(content: bytes) -> tuple[str, str]:
-        """Calculates the SHA-1 hash of the given content and returns the hash and its path.
+    def calculate_hash(content: bytes | Path, algo: str = "sha1") -> tuple[str, str]:
+        """Calculates the hash of the given content and returns the hash and its path.
+
+        A path is hashed with :meth:`calculate_hash_stream`. SHA-1 comes from OpenSSL (1.1.1
+        or later), which uses the CPU SHA extensions (x86 SHA-NI, ARMv8 SHA1) when available;
+        on CPUs without them ``blake2b`` is several times faster. ``blake3`` is faster than
+        both on large files, as it hashes with SIMD and spreads big inputs over several threads.
+        The hashes of the three algorithms differ, so SHA-1 stays the default for existing data.
 
         Args:
-            content: Bytes content to hash
+            content: Bytes content to hash (any bytes-like object, e.g. a memoryview), or
+                the path of a file to hash
+            algo: ``"sha1"``, ``"blake2b"`` or ``"blake3"`` (the last two with a 20-byte
+                digest, the same length as SHA-1, so the hash paths keep their layout)
 
         Returns:
             Tuple containing (hash_string, hash_path) where:
-            - hash_string: SHA-1 hex digest of the content
+            - hash_string: Hex digest of the content
             - hash_path: Path structure based on the hash (format: /XX/YY/XXXX...)
         """
-        hash_obj = hashlib.sha1(content)
-        contenthash: str = hash_obj.hexdigest()
-        contentpath: str = f"/{contenthash[:2]}/{contenthash[2:4]}/{contenthash}"
+        if isinstance(content, Path):
+            with open(content, "rb") as f:
+                return ResourceUtils.calculate_hash_stream(f, algo)
+
+        return ResourceUtils._hash_result(ResourceUtils._hash_constructor(algo)(content))
+
+    @staticmethod
+    def calculate_hash_stream(fp: BinaryIO, algo: str = "sha1", chunk_size: int = 1 << 20) -> tuple[str, str]:
+        """Calculates the hash of an open binary file, reading it in fixed-size chunks.
+
+        Regular files and in-memory buffers go through ``hashlib.file_digest``, which reads
+        and hashes in C without releasing a Python object per chunk. Other readers are read
+        with ``readinto`` into a single reused buffer. Either way only one chunk is held in memory.
+
+        Args:
+            fp: File-like object opened in binary mode, read from its current position
+            algo: ``"sha1"``, ``"blake2b"`` or ``"blake3"``, see :meth:`calculate_hash`
+            chunk_size: Size of each read, in bytes, when ``file_digest`` cannot be used
+
+        Returns:
+            Tuple containing (hash_string, hash_path), see :meth:`calculate_hash`
+        """
+        new_hash = ResourceUtils._hash_constructor(algo)
+        try:
+            return ResourceUtils._hash_result(hashlib.file_digest(fp, new_hash))
+        except ValueError:
+            # Not a readable binary file object as file_digest expects it
+            pass
+
+        hash_obj = new_hash()
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while size := fp.readinto(buffer):
+            hash_obj.update(view[:size])
+        return ResourceUtils._hash_result(hash_obj)
+
+    @staticmethod
+    def _hash_constructor(algo: str):
+        # Content hashes are identifiers, not security checks: usedforsecurity=False keeps
+        # them available on FIPS-restricted OpenSSL builds
+        if algo == "blake2b":
+            return partial(hashlib.blake2b, digest_size=20, usedforsecurity=False)
+        if algo == "sha1":
+            return _sha1
+        if algo == "blake3":
+            return _blake3
+        raise ValueError(f"Unsupported hash algorithm: {algo}")
+
+    @staticmethod
+    def _digest(hash_obj) -> bytes:
+        # BLAKE3 digests are 32 bytes by default; their first 20 bytes are the same as
+        # asking for a 20-byte output
+        return hash_obj.digest()[:20]
+
+    @staticmethod
+    def _hash_result(hash_obj) -> tuple[str, str]:
+        contenthash: str = ResourceUtils._digest(hash_obj).hex()
+        contentpath: str = "/".join(("", contenthash[:2], contenthash[2:4], contenthash))
         return (contenthash, contentpath)
 
+    @staticmethod
+    def calculate_hash_raw(content: bytes, algo: str = "sha1") -> bytes:
+        """Calculates the digest of the given content.
+
+        Half the size of the hex string returned by :meth:`calculate_hash`, so it is the
+        better choice for large in-memory sets of hashes (e.g. to find duplicates).
+
+        Args:
+            content: Bytes content to hash
+            algo: Hash algorithm, as in :meth:`calculate_hash`
+
+        Returns:
+            The raw 20-byte digest, suitable for feeding another hash
+        """
+        return ResourceUtils._digest(ResourceUtils._hash_constructor(algo)(content))
+
+    @staticmethod
+    def calculate_file_hash_raw(file_path: Path, algo: str = "sha1") -> bytes:
+        """Calculates the digest of a file, reading it in chunks.
+
+        Args:
+            file_path: Path of the file to hash
+            algo: Hash algorithm, as in :meth:`calculate_hash`
+
+        Returns:
+            The raw 20-byte digest
+        """
+        with open(file_path, "rb") as f:
+            return ResourceUtils._digest(hashlib.file_digest(f, ResourceUtils._hash_constructor(algo)))
+
     @staticmethod
     def hash_image_pixel_data(raw_bytes: bytes) -> tuple[str, str]:
         """Calculates the SHA-1 hash of the pixel data of an image from raw bytes.
 
+        The RGB rows are hashed in strips of :attr:`PIXEL_HASH_STRIP_ROWS`, so no full
+        copy of the pixel data is made besides the decoded image itself; the result is
+        the same as hashing all the rows at once.
+
         Args:
             raw_bytes: Image file in bytes format
 
         Returns:
             Tuple with (hash_string, hash_path) of the pixel data
         """
-        img = Image.open(io.BytesIO(raw_bytes)).convert('RGB')
-        data = img.tobytes()
-        return ResourceUtils.calculate_hash(data)
+        return ResourceUtils._hash_pixels(Image.open(io.BytesIO(raw_bytes)))
+
+    @staticmethod
+    def calculate_hashes(content: bytes | Path) -> Dict[str, tuple[str, str]]:
+        """Calculates the content hash and the pixel data hash of an image together.
+
+        The file is read once and its bytes are shared by both hashes, instead of
+        reading them again for :meth:`hash_image_pixel_data`.
+
+        Args:
+            content: Image file in bytes format, or the path of the image file
+
+        Returns:
+            Dictionary with the (hash_string, hash_path) tuples of the file content
+            (``"content"``, as :meth:`calculate_hash`) and of the pixel data
+            (``"pixel"``, as :meth:`hash_image_pixel_data`)
+        """
+        if isinstance(content, Path):
+            content = content.read_bytes()
+
+        data = memoryview(content)
+        return {
+            "content": ResourceUtils._hash_result(_sha1(data)),
+            "pixel": ResourceUtils._hash_pixels(Image.open(io.BytesIO(data))),
+        }
+
+    @staticmethod
+    def _hash_pixels(img: Image.Image) -> tuple[str, str]:
+        """Hashes the RGB rows of an image in strips of :attr:`PIXEL_HASH_STRIP_ROWS`."""
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+
+        width, height = img.size
+        hash_obj = _sha1()
+        for y in range(0, height, ResourceUtils.PIXEL_HASH_STRIP_ROWS):
+            strip = img.crop((0, y, width, min(y + ResourceUtils.PIXEL_HASH_STRIP_ROWS, height)))
+            hash_obj.update(strip.tobytes())
+        return ResourceUtils._hash_result(hash_obj)
 
     @staticmethod
     def get_exif_from_bytes(image_bytes: bytes) -> dict:
@@ -121,6 +273,58 @@ class ResourceUtils:
             if tag_id in exif_data
         }
 
+    @staticmethod
+    def get_exif_from_file(file_path: Path | BinaryIO) -> dict:
+        """Extracts EXIF data from an image file without loading the whole file.
+
+        Args:
+            file_path: Path of the image file, or the file already opened in binary mode
+
+        Returns:
+            Dictionary containing all EXIF tags found in the image
+        """
+        with Image.open(file_path) as image:
+            exif_data = image.getexif()
+
+        return {
+            ExifTags.TAGS.get(tag_id, tag_id): value
+            for tag_id, value in exif_data.items()
+        }
+
+    @staticmethod
+    def get_exif_from_image(image: Image.Image) -> dict:
+        """Extracts the date and camera EXIF tags from an already opened image.
+
+        The keys use ExifTool's group prefix (``EXIF:DateTimeOriginal``, ``EXIF:Make``...),
+        so the result can be passed to :meth:`parse_date_recorded` and :meth:`get_camera_model`
+        without running ExifTool on a file that is already in memory.
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            Dictionary with the EXIF tags found in the image
+        """
+        exif_data = image.getexif()
+        exif_ifd = exif_data.get_ifd(ExifTags.IFD.Exif)
+
+        metadata = {}
+        for key, tag_id, source in (
+            ("EXIF:Make", ExifTags.Base.Make, exif_data),
+            ("EXIF:Model", ExifTags.Base.Model, exif_data),
+            ("EXIF:ModifyDate", ExifTags.Base.DateTime, exif_data),
+            ("EXIF:DateTimeOriginal", ExifTags.Base.DateTimeOriginal, exif_ifd),
+            ("EXIF:CreateDate", ExifTags.Base.DateTimeDigitized, exif_ifd),
+        ):
+            value = source.get(tag_id)
+            if isinstance(value, str):
+                # ExifTool drops the NUL padding and trailing spaces of ASCII tags
+                value = value.rstrip("\x00 ")
+            if value:
+                metadata[key] = value
+
+        return metadata
+
     @staticmethod
     def get_exif_tag(image_bytes: bytes, tag_name_to_find: str):
         """Gets a specific EXIF tag from image bytes.
@@ -132,15 +336,108 @@ class ResourceUtils:
         Returns:
             Value of the requested EXIF tag, or None if not found
         """
+        return ResourceUtils.get_exif_tags(image_bytes, (tag_name_to_find,)).get(tag_name_to_find)
+
+    @staticmethod
+    def get_exif_tags(image_bytes: bytes, tag_names: tuple[str, ...]) -> dict:
+        """Gets some EXIF tags of the first IFD from image bytes.
+
+        For JPEG images the EXIF segment is located by walking the marker segments and
+        the IFD entries are read with ``struct``, without going through Pillow. Images
+        that are not JPEG, or tags that are not plain text, fall back to
+        :meth:`get_exif_from_bytes`, so the values are the same either way.
+
+        Args:
+            image_bytes: Image file in bytes format
+            tag_names: Names of the EXIF tags to retrieve (e.g. ``"Make"``, ``"Model"``)
+
+        Returns:
+            Dictionary with the requested tags found in the image
+        """
+        ifd0 = ResourceUtils._scan_jpeg_ifd0(image_bytes)
+        if ifd0 is not None:
+            tag_ids, ascii_tags = ifd0
+            found = {}
+            for name in tag_names:
+                tag_id = _EXIF_TAG_IDS.get(name)
+                if tag_id in ascii_tags:
+                    found[name] = ascii_tags[tag_id]
+                elif tag_id in tag_ids:
+                    break  # Present but not text: let Pillow decode it
+            else:
+                return found
+
         exif_data = ResourceUtils.get_exif_from_bytes(image_bytes)
-        return exif_data.get(tag_name_to_find)  # Simplified with .get()
+        return {name: exif_data[name] for name in tag_names if name in exif_data}
+
+    @staticmethod
+    def _scan_jpeg_ifd0(image_bytes: bytes) -> Optional[tuple[set, Dict[int, str]]]:
+        """Reads the first IFD of a JPEG's EXIF segment.
+
+        Returns:
+            The ids of all the tags in the IFD and the values of its ASCII tags, or None
+            if the image is not a JPEG with a readable EXIF segment
+        """
+        data = memoryview(image_bytes)
+        if data[:2] != b"\xff\xd8":
+            return None
+
+        # Walk the marker segments up to the start of the compressed data
+        pos, size = 2, len(data)
+        while pos + 4 <= size and data[pos] == 0xFF:
+            marker = data[pos + 1]
+            if marker == 0xDA:
+                return set(), {}  # No EXIF segment before the image data
+            (length,) = struct.unpack_from(">H", data, pos + 2)
+            if marker == 0xE1 and data[pos + 4:pos + 10] == b"Exif\x00\x00":
+                tiff = data[pos + 10:pos + 2 + length]
+                break
+            pos += 2 + length
+        else:
+            return None
+
+        try:
+            if tiff[:2] == b"II":
+                order = "<"
+            elif tiff[:2] == b"MM":
+                order = ">"
+            else:
+                return None
+            (ifd,) = struct.unpack_from(order + "I", tiff, 4)
+            (count,) = struct.unpack_from(order + "H", tiff, ifd)
+
+            tag_ids, ascii_tags = set(), {}
+            for entry in range(ifd + 2, ifd + 2 + 12 * count, 12):
+                tag_id, tag_type, n, value = struct.unpack_from(order + "HHII", tiff, entry)
+                tag_ids.add(tag_id)
+                if tag_type == 2:  # ASCII, decoded as Pillow does
+                    offset = entry + 8 if n <= 4 else value
+                    text = bytes(tiff[offset:offset + n])
+                    if text.endswith(b"\x00"):
+                        text = text[:-1]
+                    ascii_tags[tag_id] = text.decode("latin-1", "replace")
+        except struct.error:
+            return None
+
+        return tag_ids, ascii_tags
 
     @staticmethod
     def normalize_jpeg(image_bytes: bytes) -> bytes:
-        """Ensure JPEG is valid and compatible with XMP writing."""
+        """Ensure JPEG is valid and compatible with XMP writing.
+
+        A complete JPEG (start and end of image markers, and a header Pillow can parse)
+        is returned unchanged; anything else is decoded and re-encoded, keeping the
+        original quantization tables when the source is a JPEG.
+        """
         img = Image.open(io.BytesIO(image_bytes))
+        if img.format == "JPEG" and image_bytes[:3] == b"\xff\xd8\xff" and image_bytes[-2:] == b"\xff\xd9":
+            return image_bytes
+
         buf = io.BytesIO()
-        img.save(buf, format="JPEG")
+        if img.format == "JPEG":
+            img.save(buf, format="JPEG", quality="keep")
+        else:
+            img.save(buf, format="JPEG")
         return buf.getvalue()
 
     @staticmethod
@@ -178,18 +475,7 @@ class ResourceUtils:
             raise ValueError(f"File does not exist: {file_path}")
 
         try:
-            # Build parameters
-            params = ["-n", "-j"]  # numeric values
-
-            if all_tags:
-                params.append("-a")  # allow duplicate tags
-            elif tags:
-                # Convert ["DateTimeOriginal", "Model"] → ["-DateTimeOriginal", "-Model"]
-                params.extend([f"-{t}" for t in tags])
-
-            # Extra arguments
-            if extra_args:
-                params.extend(extra_args)
+            params = ResourceUtils._exiftool_read_params(tags, all_tags, extra_args)
 
             # Extract metadata
             with exiftool.ExifToolHelper() as et:
@@ -198,16 +484,130 @@ class ResourceUtils:
             if not results or not isinstance(results, list):
                 raise Exception("ExifTool returned empty or invalid metadata structure")
 
-            metadata = results[0].copy()
-
-            # Clean up internal fields
-            metadata.pop("SourceFile", None)
-            metadata.pop("ExifToolVersion", None)
-
-            return metadata
+            return ResourceUtils._clean_exiftool_metadata(results[0])
         except Exception as e:
             raise Exception(f"Metadata extraction failed for {file_path}: {e}")
 
+    @staticmethod
+    def get_exif_from_paths(
+            file_paths: List[Path],
+            tags: Optional[List[str]] = None,
+            all_tags: bool = False,
+            extra_args: Optional[List[str]] = None,
+            batch_size: int = 256,
+    ) -> Dict[Path, Union[Dict, Exception]]:
+        """Extract metadata from many local files with a single ExifTool process.
+
+        Equivalent to calling :meth:`get_exif_from_path` for every file, but the
+        ExifTool process is started once and each batch of ``batch_size`` files is
+        read with a single command, instead of paying the process start-up per file.
+        If a batch fails, its files are read one by one so that a single unreadable
+        file only affects its own entry.
+
+        Args:
+            file_paths: Paths of the local files to read.
+            tags: List of specific tags to extract. If None and all_tags=False, returns basic metadata.
+            all_tags: If True, extract ALL available tags (slower).
+            extra_args: Additional raw ExifTool arguments (e.g. ["-G1"])
+            batch_size: Number of files read per ExifTool command.
+
+        Returns:
+            Dict mapping each path to its metadata, or to the exception raised while reading it.
+        """
+        results: Dict[Path, Union[Dict, Exception]] = {}
+        for batch_results in ResourceUtils.iter_exif_from_paths(file_paths, tags, all_tags, extra_args, batch_size):
+            results.update(batch_results)
+        return results
+
+    @staticmethod
+    def iter_exif_from_paths(
+            file_paths: List[Path],
+            tags: Optional[List[str]] = None,
+            all_tags: bool = False,
+            extra_args: Optional[List[str]] = None,
+            batch_size: int = 256,
+    ) -> Iterator[Dict[Path, Union[Dict, Exception]]]:
+        """Like :meth:`get_exif_from_paths`, but yield the results of each batch as soon as it is read.
+
+        Missing files are yielded first, in a batch of their own. Errors starting ExifTool are
+        raised when the first batch of existing files is requested.
+
+        Yields:
+            Dict mapping each path of the batch to its metadata, or to the exception raised while reading it.
+        """
+        params = ResourceUtils._exiftool_read_params(tags, all_tags, extra_args)
+
+        missing: Dict[Path, Union[Dict, Exception]] = {}
+        pending = []
+        for file_path in file_paths:
+            if not isinstance(file_path, Path) or not file_path.is_file():
+                missing[file_path] = ValueError(f"File does not exist: {file_path}")
+            else:
+                pending.append(file_path)
+
+        if missing:
+            yield missing
+        if not pending:
+            return
+
+        with exiftool.ExifToolHelper() as et:
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                try:
+                    metadata = et.get_metadata([str(p) for p in batch], params=params)
+                    if not isinstance(metadata, list) or len(metadata) != len(batch):
+                        raise Exception("ExifTool returned empty or invalid metadata structure")
+                except Exception:
+                    metadata = None
+
+                if metadata is not None:
+                    # ExifTool answers in the order the files were given
+                    yield {
+                        file_path: ResourceUtils._clean_exiftool_metadata(entry)
+                        for file_path, entry in zip(batch, metadata)
+                    }
+                    continue
+
+                results: Dict[Path, Union[Dict, Exception]] = {}
+                for file_path in batch:
+                    try:
+                        entry = et.get_metadata(str(file_path), params=params)
+                        if not entry or not isinstance(entry, list):
+                            raise Exception("ExifTool returned empty or invalid metadata structure")
+                        results[file_path] = ResourceUtils._clean_exiftool_metadata(entry[0])
+                    except Exception as e:
+                        results[file_path] = Exception(f"Metadata extraction failed for {file_path}: {e}")
+                yield results
+
+    @staticmethod
+    def _exiftool_read_params(
+            tags: Optional[List[str]],
+            all_tags: bool,
+            extra_args: Optional[List[str]],
+    ) -> List[str]:
+        """Build the ExifTool parameters shared by the metadata readers."""
+        params = ["-n", "-j"]  # numeric values
+
+        if all_tags:
+            params.append("-a")  # allow duplicate tags
+        elif tags:
+            # Convert ["DateTimeOriginal", "Model"] → ["-DateTimeOriginal", "-Model"]
+            params.extend([f"-{t}" for t in tags])
+
+        # Extra arguments
+        if extra_args:
+            params.extend(extra_args)
+
+        return params
+
+    @staticmethod
+    def _clean_exiftool_metadata(entry: Dict) -> Dict:
+        """Copy an ExifTool result without its internal fields."""
+        metadata = entry.copy()
+        metadata.pop("SourceFile", None)
+        metadata.pop("ExifToolVersion", None)
+        return metadata
+
     @staticmethod
     def add_metadata(images: List[Path], xmp_info: dict) -> bytes:
         """Adds metadata to an image file using ExifTool.
@@ -231,92 +631,217 @@ class ResourceUtils:
         return None
 
     @staticmethod
-    def add_xmp_metadata(image_bytes: bytes, resource) -> bytes:
+    def add_metadata_batch(
+            items: List[tuple[Path, dict, Optional[Path]]],
+            et: Optional[exiftool.ExifToolHelper] = None,
+    ) -> Dict[Path, str]:
+        """Adds per-file metadata to several image files using a single ExifTool process.
+
+        When a destination is given, ExifTool reads the image and writes the tagged copy
+        there in a single pass (``-o``), leaving the source untouched; otherwise the image
+        is modified in place.
+
+        Args:
+            items: Triples of (image path, tags to write on that image, destination path or None)
+            et: Running ExifTool to write with, e.g. to share one process between several
+                batches; it is left running. A new one is started for this batch if not given.
+
+        Returns:
+            Error message for each written path (the destination, or the image path when
+            modified in place) whose metadata could not be written
+        """
+        errors = {}
+        if not items:
+            return errors
+
+        with nullcontext(et) if et is not None else exiftool.ExifToolHelper() as et:
+            for path, tags, dest in items:
+                try:
+                    if dest is None:
+                        et.set_tags([path], tags=tags, params=["-overwrite_original"])
+                    else:
+                        et.set_tags([path], tags=tags, params=["-o", str(dest)])
+                except Exception as e:
+                    errors[dest or path] = str(e)
+
+        return errors
+
+    @staticmethod
+    def add_xmp_metadata(image: Union[Path, bytes], resource) -> Optional[bytes]:
         """Adds metadata to an image file using ExifTool.
 
+        When ``image`` is a path the file is updated in place, so no copy of the image
+        is written or read back. Image bytes go through a temporary file.
+
         Args:
-            image_bytes: Original image in bytes format
+            image: Path of the image file to update, or original image in bytes format
             resource: Resource object containing metadata to add
 
         Returns:
-            New image bytes with added metadata
+            New image bytes with added metadata, or None if ``image`` is a path
         """
+        if isinstance(image, Path):
+            # Pillow only reads the header to get the EXIF
+            exif = ResourceUtils.get_exif_from_file(image)
+            tags = ResourceUtils._xmp_tags(exif.get("Make"), exif.get("Model"), resource)
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp_file:
-            tmp_file.write(image_bytes)
-            tmp_file.flush()
-            tmp_file_path = tmp_file.name
+            with exiftool.ExifToolHelper() as et:
+                et.set_tags([str(image)], tags=tags, params=["-overwrite_original"])
+            return None
 
-        try:
-            make = ResourceUtils.get_exif_tag(image_bytes, "Make")
-            model = ResourceUtils.get_exif_tag(image_bytes, "Model")
-            location = resource.deployment.location
-            owner = resource.deployment.owner
-            publisher = resource.deployment.publisher
-
-            resource_dc_creator = f"CT ({make} {model} {location.name})" if make and model else f"CT (Unknown Make and Model) {location.name}"
-            where = location.description if location.description else "Unknown Location"
-            resource_photoshop_AuthorsPosition = f"This image was taken in {where}, as part of the WildINTEL project. https://wildintel.eu/"
-            year = datetime.datetime.now().year
-            resource_dc_rights = f"© {owner}, {year}. All rights reserved."
-            resource_xmpRights_Marked = True
-            resource_xmpRights_WebStatement = "https://creativecommons.org/licenses/by/4.0/"
-
-            # Creamos el diccionario de etiquetas XMP
-            # tags = {
-            # Dublin Core
-            #    "XMP-dc:Creator": resource.dc_creator,
-            #    "XMP-dc:Date": resource.recordered_at.isoformat(),
-            #    "XMP-dc:Format": resource.mimetype,
-            #    "XMP-dc:Identifier": f"WildINTEL:{resource.contenthash}",
-            #    "XMP-dc:Source": f"WildINTEL:{resource.parentcontenthash}",
-            #    "XMP-dc:Publisher": publisher,
-            #    "XMP-dc:Rights": resource.dc_rights,
-            #    "XMP-dc:Coverage": resource.photoshop_AuthorsPosition,
+        # One EXIF read for both tags
+        exif = ResourceUtils.get_exif_tags(image, ("Make", "Model"))
+        tags = ResourceUtils._xmp_tags(exif.get("Make"), exif.get("Model"), resource)
 
-            # XMP Rights
-            #    "XMP-xmpRights:Marked": str(resource.xmpRights_Marked).lower(),
-            #    "XMP-xmpRights:Owner": owner,
-            #    "XMP-xmpRights:WebStatement": resource.xmpRights_WebStatement,
-            # }
-
-            tags = {
-                # Dublin Core
-                "XMP-dc:Creator": resource_dc_creator,
-                "XMP-dc:Date": resource.recordered_at.isoformat(),
-                "XMP-dc:Format": resource.mimetype,
-                "XMP-dc:Identifier": f"WildINTEL:{resource.contenthash}",
-                "XMP-dc:Source": f"WildINTEL:{resource.parentcontenthash}",
-                "XMP-dc:Publisher": publisher,
-                "XMP-dc:Rights": resource_dc_rights,
-                "XMP-dc:Coverage": resource_photoshop_AuthorsPosition,
-
-                # XMP Rights
-                "XMP-xmpRights:Marked": str(resource_xmpRights_Marked).lower(),
-                "XMP-xmpRights:Owner": owner,
-                "XMP-xmpRights:WebStatement": resource_xmpRights_WebStatement,
-            }
+        # The file is removed when the block exits, not when it is closed, so ExifTool
+        # can rewrite it in between
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete_on_close=False) as tmp_file:
+            tmp_file.write(image)
+            tmp_file.close()
 
             # Escribir metadatos con ExifTool
             with exiftool.ExifToolHelper() as et:
-                et.set_tags([tmp_file_path], tags=tags, params=["-overwrite_original"])
+                et.set_tags([tmp_file.name], tags=tags, params=["-overwrite_original"])
 
             # Leer el archivo con metadatos actualizados
-            with open(tmp_file_path, "rb") as f:
+            with open(tmp_file.name, "rb") as f:
                 updated_bytes = f.read()
 
-        finally:
-            os.remove(tmp_file_path)
-
         return updated_bytes
 
     @staticmethod
-    def resize(img: Image.Image, basewidth: int = 2400) -> tuple[bool, Image.Image]:
+    def _xmp_tags(make: Optional[str], model: Optional[str], resource) -> dict:
+        """Builds the XMP tags written by :meth:`add_xmp_metadata`."""
+        location = resource.deployment.location
+        owner = resource.deployment.owner
+        publisher = resource.deployment.publisher
+
+        resource_dc_creator = f"CT ({make} {model} {location.name})" if make and model else f"CT (Unknown Make and Model) {location.name}"
+        where = location.description if location.description else "Unknown Location"
+        resource_photoshop_AuthorsPosition = f"This image was taken in {where}, as part of the WildINTEL project. https://wildintel.eu/"
+        year = datetime.now().year
+        resource_dc_rights = f"© {owner}, {year}. All rights reserved."
+        resource_xmpRights_Marked = True
+        resource_xmpRights_WebStatement = "https://creativecommons.org/licenses/by/4.0/"
+
+        return {
+            # Dublin Core
+            "XMP-dc:Creator": resource_dc_creator,
+            "XMP-dc:Date": resource.recordered_at.isoformat(),
+            "XMP-dc:Format": resource.mimetype,
+            "XMP-dc:Identifier": f"WildINTEL:{resource.contenthash}",
+            "XMP-dc:Source": f"WildINTEL:{resource.parentcontenthash}",
+            "XMP-dc:Publisher": publisher,
+            "XMP-dc:Rights": resource_dc_rights,
+            "XMP-dc:Coverage": resource_photoshop_AuthorsPosition,
+
+            # XMP Rights
+            "XMP-xmpRights:Marked": str(resource_xmpRights_Marked).lower(),
+            "XMP-xmpRights:Owner": owner,
+            "XMP-xmpRights:WebStatement": resource_xmpRights_WebStatement,
+        }
+
+    @staticmethod
+    def process_many(
+            paths: List[Path],
+            deployment_id: str,
+            timezone: ZoneInfo = ZoneInfo("UTC"),
+            ignore_dst: bool = False,
+            valid_types: Enum = None,
+            workers: Optional[int] = None,
+    ) -> Iterator[Union[ResourceEntityDTO, Exception]]:
+        """Hashes, validates and dates many resource files concurrently.
+
+        The files are read, hashed and checked in a thread pool (hashing and file I/O
+        release the GIL), while their metadata is read with a single ExifTool process
+        (:meth:`get_exif_from_paths`) running alongside in the same pool.
+
+        Args:
+            paths: Paths of the resource files
+            deployment_id: Deployment the resources belong to
+            timezone: Timezone used to interpret naive EXIF timestamps
+            ignore_dst: If True, the DST offset is ignored when localising the timestamps
+            valid_types: Enum of the accepted MIME types (``ResourceMymeTypeDTO`` by default)
+            workers: Number of threads; by default four per CPU, up to 32
+
+        Returns:
+            Iterator over the resources in the order of ``paths``, without their content.
+            A file that cannot be processed yields the exception raised for it instead.
+        """
+        if valid_types is None:
+            valid_types = ResourceMymeTypeDTO
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            exif_future = executor.submit(
+                ResourceUtils.get_exif_from_paths, paths, ResourceUtils.METADATA_EXIF_TAGS
+            )
+            check = partial(ResourceUtils._hash_and_validate, valid_types=valid_types)
+            for sortorder, (path, checked) in enumerate(zip(paths, executor.map(check, paths))):
+                if isinstance(checked, Exception):
+                    yield checked
+                    continue
+
+                metadata = exif_future.result()[path]
+                if isinstance(metadata, Exception):
+                    yield metadata
+                    continue
+
+                contenthash, pathnamehash, filesize, mimetype = checked
+                try:
+                    recorded_at = ResourceUtils.parse_date_recorded(
+                        metadata, timezone=timezone, ignore_dst=ignore_dst
+                    )
+                except Exception as e:
+                    yield e
+                    continue
+
+                yield ResourceEntityDTO(
+                    contenthash=contenthash,
+                    pathnamehash=pathnamehash,
+                    filesize=filesize,
+                    mimetype=mimetype,
+                    filename=path.name,
+                    recordered_at=recorded_at,
+                    deployment_id=deployment_id,
+                    sortorder=sortorder,
+                )
+
+    @staticmethod
+    def _hash_and_validate(path: Path, valid_types: Enum) -> Union[tuple, Exception]:
+        """Hashes a file and checks its MIME type for :meth:`process_many`."""
+        try:
+            data = path.read_bytes()
+            contenthash, pathnamehash = ResourceUtils.calculate_hash(data)
+            valid, mimetype = ResourceUtils.validate_mime_type(data, valid_types)
+            if not valid:
+                raise ValueError(f"Unsupported MIME type {mimetype}: {path}")
+            return contenthash, pathnamehash, len(data), valid_types(mimetype)
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def resize(
+            img: Union[Image.Image, Path, bytes],
+            basewidth: int = 2400,
+            resample: Image.Resampling = Image.Resampling.LANCZOS,
+            reducing_gap: Optional[float] = None,
+    ) -> tuple[bool, Image.Image]:
         """Resizes an image while maintaining aspect ratio.
 
+        JPEG images that have not been decoded yet are decoded directly at the smallest
+        power-of-two reduction that is still at least as large as the target
+        (``Image.draft``), so a 6000px photo resized to 2400px is decoded at 3000px.
+
         Args:
-            img: PIL Image object
+            img: PIL Image object, or path or bytes of the image file
             basewidth: Target width in pixels
+            resample: Resampling filter
+            reducing_gap: If given, the image is first reduced by an integer factor with a
+                box filter until it is less than ``reducing_gap`` times the target size,
+                which is much faster on large ratios. 3.0 is indistinguishable from a
+                plain resample; None resamples the full image.
 
         Returns:
             Tuple of (error_flag, resized_image) where:
@@ -324,9 +849,17 @@ class ResourceUtils:
             - resized_image: Resized PIL Image object or None if failed
         """
         try:
+            if isinstance(img, Path):
+                img = Image.open(img)
+            elif isinstance(img, (bytes, bytearray, memoryview)):
+                img = Image.open(io.BytesIO(img))
+
             wpercent = (basewidth / float(img.size[0]))
             hsize = int((float(img.size[1]) * float(wpercent)))
-            img_new = img.resize((basewidth, hsize), Image.LANCZOS)
+            if img.format == "JPEG":
+                # No effect if the image is already loaded
+                img.draft(img.mode, (basewidth, hsize))
+            img_new = img.resize((basewidth, hsize), resample, reducing_gap=reducing_gap)
             return (False, img_new)
         except Exception:
             return (True, None)
@@ -339,12 +872,21 @@ class ResourceUtils:
 
         detected_type = ResourceUtils.get_mime_type(image_bytes)
 
-        if detected_type not in {mime.value for mime in valid_types}:
+        if detected_type not in _enum_values(valid_types):
             return False, detected_type
         return True, detected_type
 
     @staticmethod
     def get_mime_type(image_bytes: bytes) -> str:
+        # Common camera formats are recognized from their signature; anything else
+        # (including PNG, which filetype may report as APNG) goes through filetype
+        head = bytes(memoryview(image_bytes)[:12])
+        for magic, mime in _MAGIC_PREFIXES:
+            if head.startswith(magic):
+                return mime
+        if head[:4] == b"RIFF" and head[8:12] in _RIFF_MIME_TYPES:
+            return _RIFF_MIME_TYPES[head[8:12]]
+
         kind = filetype.guess(image_bytes)
 
         if kind is None:
@@ -363,7 +905,7 @@ class ResourceUtils:
         return Image.open(io.BytesIO(img_path.read_bytes()))
 
     @staticmethod
-    def image_to_bytes(pil_image: Image.Image, format: str = "JPEG") -> bytes:
+    def image_to_bytes(pil_image: Image.Image, format: str = "JPEG", optimize: bool = True) -> bytes:
         """
         Convert a PIL image to raw bytes.
 
@@ -372,14 +914,42 @@ class ResourceUtils:
         :param format: The output image format (e.g. "JPEG", "PNG").
                        Defaults to "JPEG".
         :type format: str
+        :param optimize: Whether to optimize the encoding (and write progressive JPEG) for a
+                         smaller output. It is slower, very much so for large PNG images.
+                         Defaults to True.
+        :type optimize: bool
         :return: The image encoded as bytes.
         :rtype: bytes
         """
         buffer = io.BytesIO()
-        pil_image.save(buffer, format=format)
-        buffer.seek(0)
+        pil_image.save(buffer, format=format, quality=85, optimize=optimize,
+                       progressive=optimize and format == "JPEG")
         return buffer.getvalue()
 
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def parse_exif_datetime(value: str) -> datetime:
+        """Parses an EXIF ``YYYY:MM:DD HH:MM:SS`` timestamp into a naive datetime.
+
+        The fixed-width layout is sliced into integers directly; anything else falls
+        back to ``strptime``. Memoized because burst shots repeat the same timestamps.
+
+        Args:
+            value: Timestamp string
+
+        Returns:
+            The parsed naive datetime
+
+        Raises:
+            ValueError: If the value does not match the EXIF format
+        """
+        if (len(value) == 19 and value[4] == ":" and value[7] == ":" and value[10] == " "
+                and value[13] == ":" and value[16] == ":"
+                and (value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]).isdigit()):
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]), int(value[17:19]))
+        return datetime.strptime(value, "%Y:%m:%d %H:%M:%S")
+
     @staticmethod
     def get_camera_model(metadata: Dict[str, str]) -> str:
         """Get deployment camera model based on extracted metadata."""
@@ -469,19 +1039,14 @@ class ResourceUtils:
                     )
 
         # parse date_recorded to datetime
-        # Try multiple possible datetime formats
-        formats = [
-            "%Y:%m:%d %H:%M:%S",  # EXIF standard
-            "%Y:%m:%d %H:%M:%S%z",  # EXIF standard with timezone
-        ]
-        for fmt in formats:
+        # Try the EXIF standard first, then EXIF standard with timezone
+        try:
+            date_recorded = ResourceUtils.parse_exif_datetime(date_recorded)
+        except ValueError:
             try:
-                date_recorded = datetime.strptime(date_recorded, fmt)
-                break
+                date_recorded = datetime.strptime(date_recorded, "%Y:%m:%d %H:%M:%S%z")
             except ValueError:
-                continue
-        else:
-            raise ValueError(f"Invalid date recorded format: {date_recorded}")
+                raise ValueError(f"Invalid date recorded format: {date_recorded}")
 
         # If the datetime is naive (no timezone info), attach the specified timezone
         if date_recorded.tzinfo is None:
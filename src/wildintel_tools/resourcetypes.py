@@ -0,0 +1,39 @@
+"""
+Media types and file extensions accepted for resources.
+
+Kept apart from :mod:`wildintel_tools.resouceutils`, which re-exports them, so the CLI
+can offer them as option choices without importing Pillow, ExifTool and the hashing
+backends at startup.
+"""
+from enum import Enum, unique
+
+
+@unique
+class ResourceMymeTypeDTO(Enum):
+    image_png = "image/png"
+    image_jpeg = "image/jpeg"
+    image_gig = "image/gif"
+    image_webp = "image/webp"
+    video_mp4 = "video/mp4"
+    video_mpeg = "video/mpeg"
+    video_quicktime = "video/quicktime"
+    video_x_msvideo = "video/x-msvideo"
+
+    def __str__(self):
+        return self.value
+
+
+@unique
+class ResourceExtensionDTO(Enum):
+    png = ".png"
+    jpg = ".jpg"
+    jpeg = ".jpeg"
+    gif = ".gif"
+    webp = ".webp"
+    mp4 = ".mp4"
+    mpeg = ".mpeg"
+    mov = ".mov"
+    avi = ".avi"
+
+    def __str__(self):
+        return self.value
@@ -11,7 +11,9 @@ import os
 
 import yaml
 
+from wildintel_tools.fswalk import list_subdirs
 from wildintel_tools.reports import Report
+from wildintel_tools.progress import ProgressEvent, ProgressCallback
 from wildintel_tools.resouceutils import ResourceUtils
 
 logger = logging.getLogger(__name__)
@@ -64,6 +66,8 @@ class YAMLDefinitionGeneratorParallel:
         self.image_ext = image_ext
         self.video_ext = video_ext
         self.all_ext = image_ext + video_ext
+        # Lowercase suffixes for str.endswith; str() also accepts ResourceExtensionDTO members
+        self.ext_suffixes = tuple(str(ext).lower() for ext in self.all_ext)
         self.exiftool = exiftool
         self.max_workers = max_workers or min(32, (os.cpu_count() or 4) * 2)
 
@@ -72,7 +76,7 @@ class YAMLDefinitionGeneratorParallel:
 
     # ---------- helpers ----------
     def filter_files(self, files: list[str]) -> list[str]:
-        return [f for f in files if Path(f).suffix.lower() in self.all_ext]
+        return [f for f in files if f.lower().endswith(self.ext_suffixes)]
 
     def get_metadata(self, file_path: Path) -> dict:
         try:
@@ -92,9 +96,10 @@ class YAMLDefinitionGeneratorParallel:
         )
         return datetime.datetime.strftime(dt, "%Y-%m-%dT%H:%M:%S%z")
 
-    def build_resource(self, resource: str, base: Path) -> OrderedDict:
+    def build_resource(self, resource: str, base: Path, metadata: dict | None = None) -> OrderedDict:
         path = base / resource
-        metadata = self.get_metadata(path)
+        if metadata is None:
+            metadata = self.get_metadata(path)
 
         return OrderedDict(
             name=resource,
@@ -123,20 +128,31 @@ class YAMLDefinitionGeneratorParallel:
                 deployments=[],
             )
 
-            deployments = sorted(p.name for p in col_path.iterdir() if p.is_dir())
+            deployments = sorted(p.name for p in list_subdirs(col_path))
 
             for dep_name in deployments:
                 dep_path = col_path / dep_name
                 dep = OrderedDict(deployment_id=dep_name, resources=[])
 
-                resources = self.filter_files(
-                    sorted(p.name for p in dep_path.iterdir() if p.is_file())
-                )
+                with os.scandir(dep_path) as it:
+                    # Match the extension on the name first, so other entries never need is_file
+                    resources = sorted(e.name for e in it
+                                       if e.name.lower().endswith(self.ext_suffixes) and e.is_file())
+
+                # Read the whole deployment with one ExifTool process instead of one per file
+                paths = [dep_path / r for r in resources]
+                metadata = {}
+                for path, entry in ResourceUtils.get_exif_from_paths(
+                        paths, ResourceUtils.METADATA_EXIF_TAGS).items():
+                    if isinstance(entry, Exception):
+                        logger.error(f"EXIF failed for {path}: {entry}")
+                        entry = {}
+                    metadata[path] = entry
 
                 with ThreadPoolExecutor(self.max_workers) as ex:
                     futures = [
-                        ex.submit(self.build_resource, r, dep_path)
-                        for r in resources
+                        ex.submit(self.build_resource, r, dep_path, metadata[path])
+                        for r, path in zip(resources, paths)
                     ]
                     for f in as_completed(futures):
                         dep["resources"].append(f.result())
@@ -206,7 +222,7 @@ class DataPackageGeneratorParallel:
         self.collections = (
             collections
             if collections
-            else [p.name for p in self.data_path.iterdir() if p.is_dir()]
+            else [p.name for p in list_subdirs(self.data_path)]
         )
 
         self.timezone = timezone if isinstance(timezone, ZoneInfo) else ZoneInfo(str(timezone))
@@ -280,7 +296,7 @@ class DataPackageGeneratorParallel:
                 z.write(f, f.relative_to(self.data_path))
 
     # ---------- run ----------
-    def run(self, progress_callback=None) -> Report:
+    def run(self, progress_callback: ProgressCallback | None = None) -> Report:
         report = Report(f"Preparing packages  for Trapper")
 
         # Build full YAML once
@@ -293,7 +309,7 @@ class DataPackageGeneratorParallel:
 
             deployments = col["deployments"]
             if progress_callback:
-                progress_callback(f"collection_start:{col['name']}", len(deployments))
+                progress_callback(ProgressEvent.COLLECTION_START, col['name'], None, len(deployments))
 
             for dep in deployments:
                 dep_name = dep["deployment_id"]
@@ -305,7 +321,7 @@ class DataPackageGeneratorParallel:
                         for r in dep["resources"]
                     ]
                     if progress_callback:
-                        progress_callback(f"deployment_start:{col['name']}:{dep_name}", len(files))
+                        progress_callback(ProgressEvent.DEPLOYMENT_START, col['name'], dep_name, len(files))
 
                     parts = self.split(files)
 
@@ -325,19 +341,19 @@ class DataPackageGeneratorParallel:
 
                     report.add_success(dep_name, "deployment exported")
                     if progress_callback:
-                        progress_callback(f"file_progress:{col['name']}:{dep_name}:none", len(files))
-                        progress_callback(f"deployment_complete:{col['name']}:{dep_name}", 1)
+                        progress_callback(ProgressEvent.FILE_PROGRESS, col['name'], dep_name, len(files))
+                        progress_callback(ProgressEvent.DEPLOYMENT_COMPLETE, col['name'], dep_name, 1)
 
                 except Exception as e:
                     report.add_error(dep_name, "deployment exported", str(e))
                     if progress_callback:
-                        progress_callback(f"deployment_error:{dep_name}", 0)
+                        progress_callback(ProgressEvent.DEPLOYMENT_ERROR, col_name, dep_name, 0)
 
             if progress_callback:
-                progress_callback(f"collection_done:{col['name']}", len(deployments))
+                progress_callback(ProgressEvent.COLLECTION_DONE, col['name'], None, len(deployments))
 
         if progress_callback:
-            progress_callback("finished", 0)
+            progress_callback(ProgressEvent.FINISHED, None, None, 0)
 
         report.finish()
         return report
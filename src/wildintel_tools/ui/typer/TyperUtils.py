@@ -1,3 +1,4 @@
+import copy
 import json
 import os
 import sys
@@ -6,6 +7,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Callable, Text, Tuple, Optional
 import uuid
 from datetime import datetime
+from functools import lru_cache
 import yaml
 from docutils.nodes import status
 from pydantic import BaseModel, ValidationError
@@ -30,6 +32,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Validated settings per settings file as plain dictionaries, keyed by (st_mtime_ns, st_size).
+# The configuration callbacks of the main app and of each command load the same project
+# several times per invocation; this validates it once while the file is unchanged.
+_plain_settings_cache: Dict[Path, tuple[Optional[tuple[int, int]], dict]] = {}
+
+@lru_cache(maxsize=8)
+def _settings_manager(settings_dir: Path) -> SettingsManager:
+    """Return one :class:`SettingsManager` per settings directory, so its parse cache is shared."""
+    return SettingsManager(settings_dir=settings_dir)
+
+def _file_key(path: Path) -> Optional[tuple[int, int]]:
+    """Return ``(st_mtime_ns, st_size)`` of a file, or ``None`` if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 class HierarchicalProgress:
     def __init__(self, console: Console = None):
         self.console = console or Console()
@@ -169,10 +189,16 @@ class TyperUtils:
         path = Path(file_path)
         #if path.exists() and path.is_file():
         logger.debug(f"Loading configuration from {path}")
-        settings_dir = path.parent
-        setting_manager = SettingsManager(settings_dir=settings_dir)
-        settings = setting_manager.load_settings(path.name, True, True)
-        return SettingsManager.to_plain_dict(settings)
+        settings_file = path.parent / f"{path.name}.toml"
+        key = _file_key(settings_file)
+        cached = _plain_settings_cache.get(settings_file)
+
+        if key is None or cached is None or cached[0] != key:
+            settings = _settings_manager(path.parent).load_settings(path.name, True, True)
+            cached = (_file_key(settings_file), SettingsManager.to_plain_dict(settings))
+            _plain_settings_cache[settings_file] = cached
+
+        return copy.deepcopy(cached[1])
 
         # If path does not exist or is not a file → raise
         #raise FileNotFoundError(f"Path does not exist or is not a file: {file_path}")
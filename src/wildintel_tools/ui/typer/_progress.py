@@ -0,0 +1,173 @@
+"""
+Rich rendering of the progress events emitted by the collection operations.
+
+Kept in its own fully typed module, free of closures and dynamic attributes, so it can
+be compiled with mypyc (``mypyc src/wildintel_tools/ui/typer/_progress.py``) when the
+per-file event rate makes the interpreter overhead noticeable. The pure Python version
+is used otherwise.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from wildintel_tools.progress import ProgressEvent
+
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
+
+class BufferedAdvance:
+    """
+    Coalesce ``Progress.advance`` calls for high-frequency per-file events.
+
+    Advances are accumulated per task and forwarded to Rich once a task has
+    ``max_pending`` units pending or ``interval`` seconds have passed since the last
+    flush. Callers must :meth:`flush` before anything that depends on the bars
+    being up to date (e.g. when a deployment completes).
+
+    :param progress: Rich progress instance to forward advances to.
+    :param max_pending: Pending units that trigger a flush, or ``None`` to flush on time only.
+    :param interval: Maximum seconds between flushes.
+    """
+
+    def __init__(self, progress: Progress, max_pending: Optional[int] = 64, interval: float = 0.05) -> None:
+        self._progress = progress
+        self._max_pending = max_pending
+        self._interval = interval
+        # Rich task ids are small sequential ints, so pending units are indexed by task id
+        self._pending: list[int] = []
+        self._dirty: list[TaskID] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def add(self, task_id: TaskID, count: int) -> None:
+        with self._lock:
+            pending_units = self._pending
+            if task_id >= len(pending_units):
+                pending_units.extend([0] * (task_id + 1 - len(pending_units)))
+            pending = pending_units[task_id]
+            if not pending:
+                self._dirty.append(task_id)
+            pending += count
+            pending_units[task_id] = pending
+            if (self._max_pending is not None and pending >= self._max_pending) \
+                    or time.monotonic() - self._last_flush >= self._interval:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        pending_units = self._pending
+        for task_id in self._dirty:
+            self._progress.advance(task_id, pending_units[task_id])
+            pending_units[task_id] = 0
+        self._dirty.clear()
+        self._last_flush = time.monotonic()
+
+
+class ProgressDispatcher:
+    """
+    Render one bar per collection and one nested bar per running deployment.
+
+    The bar of a deployment is removed once it completes, so each refresh renders the
+    deployments in progress rather than every deployment seen so far.
+
+    Pass :meth:`on_event` as the ``progress_callback`` of the collection operations, or
+    call the typed methods directly. See :class:`~wildintel_tools.progress.ProgressEvent`
+    for the meaning of each event.
+
+    :param progress: Rich progress instance the bars are added to.
+    :param max_pending: Pending units that trigger a flush of per-unit advances, or ``None`` to flush on time only.
+    :param advance_collection_per_unit: Whether file progress also advances the collection bar.
+    """
+
+    def __init__(
+        self,
+        progress: Progress,
+        max_pending: Optional[int] = 64,
+        advance_collection_per_unit: bool = False,
+    ) -> None:
+        self._progress = progress
+        self._buffered = BufferedAdvance(progress, max_pending=max_pending)
+        self._advance_collection_per_unit = advance_collection_per_unit
+        # Rich task id per collection. Deployments get sequential ids on dep_start; their
+        # Rich task and parent collection task are kept in lists indexed by that id.
+        self._collection_tasks: dict[str, TaskID] = {}
+        self._deployment_ids: dict[tuple[str, str], int] = {}
+        self._dep_task: list[TaskID] = []
+        self._dep_col_task: list[TaskID] = []
+
+        # Indexed by the event code, so each event is a single lookup instead of a comparison chain
+        handlers: list[Callable[[Optional[str], Optional[str], int], None]] = [self._ignore] * len(ProgressEvent)
+        handlers[ProgressEvent.COLLECTION_START] = self._on_collection_start
+        handlers[ProgressEvent.DEPLOYMENT_START] = self._on_deployment_start
+        handlers[ProgressEvent.FILE_PROGRESS] = self._on_file_progress
+        handlers[ProgressEvent.DEPLOYMENT_COMPLETE] = self._on_deployment_complete
+        self._handlers = tuple(handlers)
+
+    def col_start(self, col_name: str, total: int) -> None:
+        col_name = sys.intern(col_name)
+        if col_name not in self._collection_tasks:
+            self._collection_tasks[col_name] = self._progress.add_task(f"Collection {col_name}", total=total)
+
+    def dep_start(self, col_name: str, dep_name: str, total: int) -> int:
+        """
+        Add the bar of a deployment.
+
+        :returns: Id of the deployment, accepted by :meth:`file_by_id` and :meth:`done_by_id`.
+        """
+        col_name = sys.intern(col_name)
+        dep_id = len(self._dep_task)
+        self._deployment_ids[(col_name, sys.intern(dep_name))] = dep_id
+        self._dep_task.append(self._progress.add_task(f"  Deployment {dep_name}", total=total))
+        self._dep_col_task.append(self._collection_tasks[col_name])
+        return dep_id
+
+    def file(self, col_name: str, dep_name: str, count: int) -> None:
+        self.file_by_id(self._deployment_ids[(col_name, dep_name)], count)
+
+    def file_by_id(self, dep_id: int, count: int) -> None:
+        self._buffered.add(self._dep_task[dep_id], count)
+        if self._advance_collection_per_unit:
+            self._buffered.add(self._dep_col_task[dep_id], count)
+
+    def done(self, col_name: str, dep_name: str) -> None:
+        self.done_by_id(self._deployment_ids[(col_name, dep_name)])
+
+    def done_by_id(self, dep_id: int) -> None:
+        self._buffered.flush()
+        self._progress.advance(self._dep_col_task[dep_id], 1)
+        self._progress.remove_task(self._dep_task[dep_id])
+
+    def flush(self) -> None:
+        """Forward the pending per-unit advances to Rich."""
+        self._buffered.flush()
+
+    def on_event(self, event: ProgressEvent, col_name: Optional[str], dep_name: Optional[str], count: int) -> None:
+        self._handlers[event](col_name, dep_name, count)
+
+    # Collection events always carry the collection name, and deployment events the deployment name
+
+    def _on_collection_start(self, col_name: Optional[str], dep_name: Optional[str], count: int) -> None:
+        assert col_name is not None
+        self.col_start(col_name, count)
+
+    def _on_deployment_start(self, col_name: Optional[str], dep_name: Optional[str], count: int) -> None:
+        assert col_name is not None and dep_name is not None
+        self.dep_start(col_name, dep_name, count)
+
+    def _on_file_progress(self, col_name: Optional[str], dep_name: Optional[str], count: int) -> None:
+        assert col_name is not None and dep_name is not None
+        self.file_by_id(self._deployment_ids[(col_name, dep_name)], count)
+
+    def _on_deployment_complete(self, col_name: Optional[str], dep_name: Optional[str], count: int) -> None:
+        assert col_name is not None and dep_name is not None
+        self.done(col_name, dep_name)
+
+    def _ignore(self, col_name: Optional[str], dep_name: Optional[str], count: int) -> None:
+        pass
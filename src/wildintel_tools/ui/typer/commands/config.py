@@ -255,7 +255,6 @@ def set_param(
     project_name = ctx.obj.get("project", project_name)
     try:
         settings_manager.set_param(project_name, param_name, param_value)
-        settings = settings_manager.load_settings(project_name, validate=True)
         TyperUtils.success(f"Settings {param_name} updated successfully to {param_value} for project '{project_name}'")
     except Exception as e:
         TyperUtils.fatal(f"Settings validation error: {e}")
@@ -34,11 +34,9 @@ import logging
 
 from wildintel_tools.epicollect import get_access_token, safe_call, get_all_entries, get_project_info, entries_to_csv, \
     group_entries_by_site_and_session, generate_field_sheet
-from wildintel_tools.resouceutils import ResourceExtensionDTO
 from wildintel_tools.ui.typer import EpicollectUtils
 from wildintel_tools.ui.typer.i18n import _
 from wildintel_tools.ui.typer.TyperUtils import TyperUtils, HierarchicalProgress
-import wildintel_tools.wildintel as wildintel_processing
 from typing_extensions import Annotated
 from pathlib import Path
 from typing import List, Dict, Tuple, Any
@@ -24,12 +24,13 @@ _show_report(report, success_msg, error_msg, output)
     Render and persist a report in YAML format.
 """
 
+import os
 import tempfile
 from zoneinfo import ZoneInfo
-from trapper_client.TrapperClient import TrapperClient
 import logging
 
-from wildintel_tools.resouceutils import ResourceExtensionDTO
+from wildintel_tools.fswalk import FsIndex, list_subdirs
+from wildintel_tools.resourcetypes import ResourceExtensionDTO
 from wildintel_tools.ui.typer.i18n import _
 from wildintel_tools.ui.typer.TyperUtils import TyperUtils
 import wildintel_tools.ui.typer.wildintel as wildintel_ui
@@ -316,7 +317,9 @@ def prepare_for_trapper(
     ignore_dst: Annotated[ bool, typer.Option( help=_("Whether to ignore daylight saving time adjustments (default: True)") ) ] = True,
     convert_to_utc: Annotated[ bool, typer.Option( help=_("Whether to convert all timestamps to UTC (default: True)") ) ] = True,
     create_deployment_table: Annotated[ bool, typer.Option( help=_("Generate deployment table") )] = True,
-    max_workers: Annotated[int, typer.Option(help=_("Number of parallel threads to use ."))] = 4,
+    max_workers: Annotated[
+        int | None, typer.Option(help=_("Number of parallel workers to use (default: one per CPU, up to 32)."))
+    ] = None,
 
         config: Annotated[
         Path, typer.Option(hidden=True, help=_("File to save the report"), callback=callback_with_override)
@@ -355,6 +358,9 @@ def prepare_for_trapper(
     :type scale: bool
     :param overwrite: Whether to overwrite existing output directories.
     :type overwrite: bool
+    :param max_workers: Number of worker processes that decode, resize and hash the images.
+        Defaults to the number of CPUs, up to 32.
+    :type max_workers: int | None
     :param config: Internal option supplied by Typer config callback.
     :type config: pathlib.Path | None
     :raises typer.BadParameter: If ``data_path`` or ``output_path`` are missing or invalid.
@@ -368,6 +374,10 @@ def prepare_for_trapper(
     if output_path is None or not output_path.exists() or not output_path.is_dir():
         raise typer.BadParameter(_(f"'--output_path' is not a valid directory or does not exist."))
 
+    # The images are processed in a process pool, so there is no point in more workers than CPUs
+    if not max_workers:
+        max_workers = min(32, os.cpu_count() or 4)
+
     xmp_info = {
         "rp_name" : rp_name,
         "coverage": coverage,
@@ -568,13 +578,14 @@ def upload_trapper_package(
     if output_path is None or not output_path.exists() or not output_path.is_dir():
         raise typer.BadParameter(_(f"'--output_path' is not a valid directory or does not exist."))
     if collections is None:
-        collections = [ col.name for col in output_path.iterdir() if col.is_dir() ]
+        collections = [col.name for col in list_subdirs(output_path)]
 
     TyperUtils.debug(f"Uploading trapper package with parameters: {output_path}  {collections} ")
 
     try:
         TyperUtils.info(_(f"Uploading packages for collections {",".join(collections)} to Trapper"))
 
+        from trapper_client.TrapperClient import TrapperClient
         trapper_client = TrapperClient(
             base_url=url, user_name=user, user_password=password, access_token=None
         )
@@ -651,9 +662,12 @@ def pipeline(
     ] = None,
 ):
     if not collections:
-        collections = [entry.name for entry in data_path.iterdir() if entry.is_dir()]
+        collections = [entry.name for entry in list_subdirs(data_path)]
     else:
-        collections = [entry.name for entry in data_path.iterdir() if entry.is_dir() and entry.name in collections]
+        collections = [entry.name for entry in list_subdirs(data_path) if entry.name in collections]
+
+    # Each deployment is listed once, when checked, and the listing reused to prepare it
+    fs_index = FsIndex()
 
     for col in collections:
         TyperUtils.info(_(f"Processing collection: {col}"))
@@ -691,10 +705,11 @@ def pipeline(
                     report_deplo = wildintel_tools.ui.typer.wildintel.check_deployments(
                         data_path=Path(data_path),
                         collections=[col],
-                        deployments=deployment['name'],
+                        deployments=[deployment['name']],
                         extensions=extensions,
                         tolerance_hours=tolerance_hours,
                         max_workers=max_workers,
+                        fs_index=fs_index,
                     )
                     _show_report(
                         success_msg=_(f"Deployment {deployment['name']} in collection {col} passed validation"),
@@ -723,6 +738,7 @@ def pipeline(
                             timezone=ZoneInfo(timezone),
                             ignore_dst=ignore_dst,
                             convert_to_utc=convert_to_utc,
+                            fs_index=fs_index,
                         )
                         _show_report(
                             success_msg=_(f"Deployment {deployment['name']} in collection {col} prepared successfully for Trapper"),
@@ -780,6 +796,7 @@ def wizard_command(
                 )
 
                 try:
+                    from trapper_client.TrapperClient import TrapperClient
                     trapper_client = TrapperClient(
                         base_url=str(host),
                         user_name=login,
@@ -844,6 +861,7 @@ def wizard_command(
         msg = "This wizard will guide you through importing a new deployment."
         if typer.confirm(msg):
 
+            from trapper_client.TrapperClient import TrapperClient
             trapper_client = TrapperClient(
                 base_url=str(settings.GENERAL.host),
                 user_name=settings.GENERAL.login,
@@ -980,8 +998,10 @@ def _show_report(report:"Report", success_msg="Validation completed successfully
     if output is None:
         base_dir=TyperUtils.get_default_report_dir()
         Path.mkdir(base_dir, parents=True, exist_ok=True)
-        tmp = tempfile.NamedTemporaryFile(delete=False, dir=base_dir, prefix="report_", suffix=".yaml")
-        output = Path(tmp.name)
+        # Only the unique path is needed: the descriptor is closed before the report is written
+        fd, tmp_name = tempfile.mkstemp(dir=base_dir, prefix="report_", suffix=".yaml")
+        os.close(fd)
+        output = Path(tmp_name)
         TyperUtils.debug(f"No output file specified. Using temporary file: {output}")
     if report.get_status() == "success":
         TyperUtils.success(_(f"{success_msg}. Review the report for details {output}."))
@@ -24,6 +24,7 @@ from typer_config import conf_callback_factory
 from wildintel_tools.ui.typer.i18n import _, setup_locale
 
 import locale
+import multiprocessing
 import os
 import sys
 
@@ -38,7 +39,6 @@ import typer
 from typing_extensions import Annotated
 from typing import Optional, Any
 from pathlib import Path
-import requests
 from wildintel_tools.ui.typer.logger import logger, setup_logging
 from wildintel_tools.ui.typer.settings import SettingsManager
 from wildintel_tools.ui.typer.TyperUtils import TyperUtils
@@ -86,8 +86,15 @@ def get_latest_github_release(owner: str, repo: str) -> str:
     """
     Returns the tag name of the latest GitHub release.
     """
+    # Imported here: requests is only needed for this check, not to start the CLI
+    import requests
+
     url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-    response = requests.get(url)
+    try:
+        response = requests.get(url, timeout=3)
+    except requests.RequestException as e:
+        TyperUtils.debug(f"GitHub API request failed: {e}")
+        return None
     if response.status_code != 200:
         TyperUtils.error(_(f"GitHub API request failed with status {response.status_code}"))
         return None
@@ -188,4 +195,7 @@ def main_callback(ctx: typer.Context,
         pass
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds start process pool workers by re-running this script; let
+    # them run the pool task instead of the CLI. A no-op when not frozen.
+    multiprocessing.freeze_support()
     app()
\ No newline at end of file
@@ -16,7 +16,7 @@ and grouped into logical sections such as ``LOGGER``, ``GENERAL``, and ``WILDINT
 Example:
     .. code-block:: python
 
-        from wildintel_tools.config.settings_manager import SettingsManager
+        from wildintel_tools.ui.typer.settings import SettingsManager
 
         sm = SettingsManager()
         sm.create_project_settings("my_project")
@@ -24,20 +24,75 @@ Example:
         print(settings.GENERAL.host)
 """
 
+import copy
 import os
 import platform
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Type, get_origin, Union, get_args, Any
+from typing import Annotated, List, Optional, Dict, Type, get_origin, Union, get_args, Any
 import tempfile
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, available_timezones
 
 from dynaconf import Dynaconf
-from dynaconf import loaders
-from pydantic import BaseModel, Field, HttpUrl, EmailStr, FilePath, DirectoryPath, ValidationError, SecretStr, \
-    TypeAdapter, field_validator
+from dynaconf.loaders.toml_loader import encode_nulls
+from dynaconf.vendor import tomllib as toml_writer
+from pydantic import BaseModel, Field, HttpUrl, EmailStr, FilePath, ValidationError, SecretStr, \
+    TypeAdapter, field_validator, AfterValidator
 
 
+@lru_cache(maxsize=1)
+def _available_timezones() -> frozenset[str]:
+    """Return the IANA timezone names installed on this system, scanned once per process."""
+    return frozenset(available_timezones())
+
+def is_valid_timezone(tz: str | None) -> bool:
+    """
+    Check whether ``tz`` names a timezone known to :mod:`zoneinfo`.
+
+    Known names are answered from a cached set of available timezones; anything else
+    falls back to actually loading the zone, for installations whose timezone database
+    cannot be enumerated.
+
+    :param tz: IANA timezone name, e.g. ``Europe/Madrid``.
+    :type tz: str | None
+    :return: ``True`` if the timezone can be loaded, ``False`` otherwise.
+    :rtype: bool
+    """
+    if tz in _available_timezones():
+        return True
+    try:
+        ZoneInfo(tz)
+    except Exception:
+        return False
+    return True
+
+# Resolved once at import; SettingsManager may be instantiated several times per process
+_DEFAULT_SETTINGS_DIR = Path(os.path.expanduser("~/.wildintel-tools"))
+
+# Directories found to exist. Only positive results are kept, so a directory created afterwards
+# (e.g. between two attempts of the config wizard) is seen on the next probe.
+_existing_dirs: set[str] = set()
+
+def _is_dir(path: str) -> bool:
+    """Cached ``Path.is_dir`` probe; clear ``_existing_dirs`` when directories may have been removed."""
+    if path in _existing_dirs:
+        return True
+    if Path(path).is_dir():
+        _existing_dirs.add(path)
+        return True
+    return False
+
+def _existing_dir(value: Path) -> Path:
+    if not _is_dir(str(value)):
+        raise ValueError(f"Path does not point to a directory: {value}")
+    return value
+
+# Same contract as pydantic's DirectoryPath, but the filesystem probe is memoized
+CachedDirectoryPath = Annotated[Path, AfterValidator(_existing_dir)]
+
 class LoggerSettings(BaseModel):
     loglevel: int = Field(default=1, ge=0, le=2)
     filename: str = Field(
@@ -54,7 +109,7 @@ class GeneralSettings(BaseModel):
     verify_ssl: bool = Field(default=True)
     ffmpeg: str = Field(default="ffmpeg")
     exiftool: str = Field(default="exiftool")
-    data_dir: DirectoryPath = Field(default=Path.home() / ".wildintel-tools" / "collections")
+    data_dir: CachedDirectoryPath = Field(default=_DEFAULT_SETTINGS_DIR / "collections")
 
 class WildIntelSettings(BaseModel):
     rp_name: str = Field(default="WildINTEL")
@@ -72,13 +127,11 @@ class WildIntelSettings(BaseModel):
     convert_to_utc: bool | None = True
     remove_zip: bool | None = True
     trigger: bool | None = True
-    output_dir: DirectoryPath = Field(default=Path.home() / ".wildintel-tools" / "readycollections")
+    output_dir: CachedDirectoryPath = Field(default=_DEFAULT_SETTINGS_DIR / "readycollections")
 
     @field_validator("timezone")
     def validate_timezone(cls, v):
-        try:
-            ZoneInfo(v)
-        except Exception:
+        if not is_valid_timezone(v):
             raise ValueError(f"Invalid timezone: {v}")
         return v
 
@@ -137,6 +190,23 @@ class Settings(BaseModel):
         default_factory=ZooniverseConnectorSettings
     )
 
+def _unwrap_model_from_annotation(ann: Any) -> Optional[type[BaseModel]]:
+    """Return the :class:`BaseModel` subclass behind an annotation (directly or inside a ``Union``), if any."""
+    if ann is None:
+        return None
+    if get_origin(ann) is Union:
+        for a in get_args(ann):
+            if isinstance(a, type) and issubclass(a, BaseModel):
+                return a
+    if isinstance(ann, type) and issubclass(ann, BaseModel):
+        return ann
+    return None
+
+@lru_cache(maxsize=None)
+def _type_adapter(annotation: Any) -> TypeAdapter:
+    """Return a shared :class:`TypeAdapter` for a field annotation, building its validator only once."""
+    return TypeAdapter(annotation)
+
 class SettingsManager:
     """
     Manages Trapper-Tools configuration files across multiple projects.
@@ -159,9 +229,26 @@ class SettingsManager:
         :param settings_dir: Directory to store settings files. Defaults to ``~/.trapper-tools``.
         :type settings_dir: Optional[Path]
         """
-        self.settings_dir = Path(settings_dir) if settings_dir else Path.home() / ".wildintel-tools"
-        self.settings_dir.mkdir(parents=True, exist_ok=True)
+        self._settings_dir = Path(settings_dir) if settings_dir else _DEFAULT_SETTINGS_DIR
         self.SETTINGS_ORDER = SettingsManager._generate_settings_order()
+        # Parsed TOML contents per settings file, keyed by (st_mtime_ns, st_size)
+        self._cache: Dict[Path, tuple[tuple[int, int], dict]] = {}
+        # Project names found in settings_dir, keyed by the directory's st_mtime_ns
+        self._projects_cache: Optional[tuple[int, list[str]]] = None
+
+    @cached_property
+    def settings_dir(self) -> Path:
+        """
+        Directory where settings files are stored.
+
+        The directory is created on first access rather than in the constructor, so
+        instantiating a manager does not touch the filesystem.
+
+        :return: Settings directory.
+        :rtype: Path
+        """
+        self._settings_dir.mkdir(parents=True, exist_ok=True)
+        return self._settings_dir
 
     def create_project_settings(
         self,
@@ -184,11 +271,30 @@ class SettingsManager:
         :rtype: Path
         """
         settings_file = self.settings_dir / f"{project_name}.toml"
-        template = template or self._default_template_file()
 
-        if not template.exists():
+        # Dynaconf only has something to merge when a .env file is loaded or the environment
+        # overrides a settings key (e.g. GENERAL__HOST from docker-compose). Otherwise the
+        # defaults are written (or the template copied) directly.
+        merge_env = env_file or self._has_env_overrides()
+        if template is None and not merge_env:
+            settings_model = Settings()
+            if validate:
+                settings_model = SettingsManager.load_from_dict(SettingsManager.to_plain_dict(settings_model))
+            self.export_settings(settings_model, settings_file)
+            return settings_file
+
+        if template is None:
+            template = self._default_template
+        elif not template.exists():
             raise FileNotFoundError(f"Settings template not found: {template}")
 
+        if not merge_env:
+            if validate:
+                self._validate_file(template)
+            shutil.copyfile(template, settings_file)
+            self._cache.pop(settings_file, None)
+            return settings_file
+
         settings = Dynaconf(
             settings_files=[str(template)],
             load_dotenv=env_file,  # Load environment variables
@@ -202,6 +308,16 @@ class SettingsManager:
 
         return settings_file
 
+    def _has_env_overrides(self) -> bool:
+        """
+        Whether the process environment sets any settings section or key, e.g. ``GENERAL__HOST``.
+
+        :return: ``True`` if Dynaconf would merge an environment variable into the settings.
+        :rtype: bool
+        """
+        sections = {name.upper() for name in self.SETTINGS_ORDER}
+        return any(name.upper().split("__", 1)[0] in sections for name in os.environ)
+
     def load_settings(
         self,
         project_name: str,
@@ -221,6 +337,21 @@ class SettingsManager:
         :return: A Dynaconf object containing loaded settings.
         :rtype: Dynaconf
         """
+        _existing_dirs.clear()
+        return self.load_from_dict(self._load_raw(project_name, create), validate)
+
+    def _load_raw(self, project_name: str, create: bool = True) -> dict:
+        """
+        Return the raw settings dictionary of a project without building a :class:`Settings` model.
+
+        :param project_name: Name of the project.
+        :type project_name: str
+        :param create: Automatically create settings file if it does not exist.
+        :type create: bool
+        :raises FileNotFoundError: If the settings file does not exist and creation is disabled.
+        :return: Settings as a nested dictionary.
+        :rtype: dict
+        """
         settings_file = self.settings_dir / f"{project_name}.toml"
 
         if not settings_file.exists() and create:
@@ -228,19 +359,93 @@ class SettingsManager:
         elif not settings_file.exists():
            raise FileNotFoundError(f"Settings file not found: {settings_file}")
 
-        settings = Dynaconf(settings_files=[str(settings_file)])
-        raw = settings.to_dict()
+        return self._read_settings_file(settings_file)
+
+    def _read_settings_file(self, settings_file: Path) -> dict:
+        """
+        Return the parsed contents of a settings file, reusing the cached parse while the file is unchanged.
+
+        The cache is keyed by the file's modification time and size, so edits made outside this
+        manager are picked up on the next call. A deep copy is returned so callers may mutate it freely.
 
-        return self.load_from_dict(raw, validate)
+        :param settings_file: Path to the TOML settings file.
+        :type settings_file: Path
+        :return: Settings as a nested dictionary.
+        :rtype: dict
+        """
+        st = settings_file.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(settings_file)
+
+        if cached is None or cached[0] != key:
+            raw = Dynaconf(settings_files=[str(settings_file)]).to_dict()
+            cached = (key, raw)
+            self._cache[settings_file] = cached
+
+        return copy.deepcopy(cached[1])
+
+    def _validate_file(self, settings_file: Path) -> Settings:
+        """
+        Parse and validate a settings file once.
+
+        The parse goes through the same cache as :meth:`load_settings`, so a file that
+        validates here is not parsed again when it is loaded afterwards.
+
+        :param settings_file: Path to the TOML settings file.
+        :type settings_file: Path
+        :raises ValidationError: If the settings are not valid.
+        :return: The validated settings.
+        :rtype: Settings
+        """
+        return self.load_from_dict(self._read_settings_file(settings_file), validate=True)
 
     def list_projects(self) -> list[str]:
         """
         List all available project configuration files.
 
+        The listing is cached and only refreshed when the modification time of the
+        settings directory changes, i.e. when a file is added, removed or renamed.
+
         :return: List of project names (without the `.toml` extension).
         :rtype: list[str]
         """
-        return [f.stem for f in self.settings_dir.glob("*.toml")]
+        mtime = self.settings_dir.stat().st_mtime_ns
+
+        if self._projects_cache is None or self._projects_cache[0] != mtime:
+            with os.scandir(self.settings_dir) as entries:
+                projects = [
+                    entry.name[:-len(".toml")]
+                    for entry in entries
+                    if entry.name.endswith(".toml") and entry.is_file()
+                ]
+            self._projects_cache = (mtime, projects)
+
+        return list(self._projects_cache[1])
+
+    def validate_all(self, max_workers: int = 8) -> Dict[str, Optional[Exception]]:
+        """
+        Validate the settings of every project found in the settings directory.
+
+        Projects are validated concurrently, since the work is dominated by reading the
+        TOML files and checking that the configured directories exist.
+
+        :param max_workers: Maximum number of worker threads.
+        :type max_workers: int
+        :return: Mapping of project name to the validation error, or ``None`` if the project is valid.
+        :rtype: Dict[str, Optional[Exception]]
+        """
+
+        def _validate_one(project_name: str) -> Optional[Exception]:
+            try:
+                self._validate_file(self.get_settings_path(project_name))
+            except Exception as e:
+                return e
+            return None
+
+        _existing_dirs.clear()
+        projects = self.list_projects()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(projects, executor.map(_validate_one, projects)))
 
     def get_settings_path(self, project_name: str) -> Path:
         """
@@ -268,23 +473,21 @@ class SettingsManager:
         path = Path(setting_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         current = SettingsManager.to_plain_dict(settings_data)
+        rank = SettingsManager._settings_order_rank()
         ordered: dict = {}
 
-        for group in self.SETTINGS_ORDER:
-            ordered[group] = {}
-            for key in self.SETTINGS_ORDER[group]:
-                if group in current and key in current[group]:
-                    ordered[group][key] = current[group][key]
+        # known groups/keys follow SETTINGS_ORDER; unknown ones keep their relative order at the end
+        for group in dict.fromkeys([*rank, *current]):
+            key_rank = rank.get(group, {})
+            ordered[group] = dict(
+                sorted(current.get(group, {}).items(), key=lambda kv: key_rank.get(kv[0], len(key_rank)))
+            )
 
-        #unknown keys (not in SETTINGS_ORDER) are appended at the end
-        for g, kv in current.items():
-            if g not in ordered:
-                ordered[g] = {}
-            for k, v in kv.items():
-                if k not in ordered[g]:
-                    ordered[g][k] = v
-
-        loaders.toml_loader.write(str(setting_path), ordered, merge=False)
+        # Dynaconf vendors tomli-w as its TOML writer; call it directly instead of going through
+        # the loader, keeping the ``@none`` encoding so ``None`` values survive the round trip.
+        with open(path, "wb") as fh:
+            toml_writer.dump(encode_nulls(ordered), fh)
+        self._cache.pop(path, None)
 
     def settings_to_string(self, settings_data: Settings) -> str:
         """
@@ -310,15 +513,15 @@ class SettingsManager:
                 return str(value).lower()
             return value
 
-        lines = []
-        for group, values in ordered_settings.items():
-            lines.append(f"[{group}]")
-            for key, value in values.items():
-                value = format_value(value)
-                lines.append(f"{key} = {value}")
-            lines.append("")
+        def _emit(ordered: dict):
+            for index, (group, values) in enumerate(ordered.items()):
+                if index:
+                    yield "\n"
+                yield f"[{group}]\n"
+                for key, value in values.items():
+                    yield f"{key} = {format_value(value)}\n"
 
-        return "\n".join(lines)
+        return "".join(_emit(ordered_settings))
 
     def edit_settings(self, project_name: str, editor="nano") -> None:
         """
@@ -352,7 +555,7 @@ class SettingsManager:
 
         # Make a temporary copy of the settings file
         temp_settings_file = settings_file.with_suffix(".tmp")
-        temp_settings_file.write_text(settings_file.read_text())
+        shutil.copyfile(settings_file, temp_settings_file)
 
         while True:
             # Open editor and wait for user to finish
@@ -363,9 +566,11 @@ class SettingsManager:
             except subprocess.CalledProcessError as e:
                 raise RuntimeError(f"Failed to open editor: {e}")
 
+            # The user may have created or fixed directories while editing
+            _existing_dirs.clear()
             try:
                 # Try to load and validate the edited settings
-                self.load_settings(project_name, validate=True)
+                self._validate_file(settings_file)
                 print("✓ Settings validated successfully!")
                 # Clean up temporary file
                 temp_settings_file.unlink(missing_ok=True)
@@ -375,7 +580,7 @@ class SettingsManager:
                 retry = input("Would you like to retry editing? [y/n]: ").lower()
                 if retry != "y":
                     # Restore original settings file
-                    settings_file.write_text(temp_settings_file.read_text())
+                    shutil.copyfile(temp_settings_file, settings_file)
                     temp_settings_file.unlink(missing_ok=True)
                     print("Settings restored to original state.")
                     # Raise an error to indicate failure
@@ -400,46 +605,35 @@ class SettingsManager:
         data = settings.model_dump()
         return (data[section][key])
 
-    def _split_param(self, param: str) -> tuple[str, str]:
-        """Split SECTION.KEY into (section, key)."""
-        try:
-            section, key = param.split(".", 1)
-        except ValueError:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _split_param(param: str) -> tuple[str, str]:
+        """Split SECTION.KEY into (section, key). Results are memoized since the same keys recur."""
+        section, sep, key = param.partition(".")
+        if not sep:
             raise ValueError("Parameter must have format SECTION.KEY (e.g., GENERAL.host)")
         return section, key
 
-    def _get_section_model(self, settings: Settings, section: str, key: str):
-        if not hasattr(settings, section):
+    def _get_section_model(self, section: str, key: str) -> type[BaseModel]:
+        field_info = Settings.model_fields.get(section)
+        if field_info is None:
             raise ValueError(f"Invalid section: {section}")
-        section_model = getattr(settings, section)
+        section_model = field_info.annotation
         if key not in section_model.model_fields:
             raise ValueError(f"Invalid parameter: {section}.{key}")
         return section_model
 
-    def _parse_value(self, section_model: BaseModel, key: str, value: Any):
+    def _parse_value(self, section_model: type[BaseModel], key: str, value: Any):
         field_info = section_model.model_fields[key]
-        adapter = TypeAdapter(field_info.annotation)
+        adapter = _type_adapter(field_info.annotation)
         try:
             return adapter.validate_python(value)
         except ValidationError as e:
-            raise ValueError(f"Invalid value for {section_model.__class__.__name__}.{key}: {e}")
+            raise ValueError(f"Invalid value for {section_model.__name__}.{key}: {e}")
 
     def set_value(self, project_name: str, section: str, key: str, value, validate: bool = True):
         """Set a single setting using explicit section/key arguments."""
-        settings_file = self.get_settings_path(project_name)
-        settings: Settings = self.load_settings(project_name)
-
-        section_model = self._get_section_model(settings, section, key)
-        parsed_value = self._parse_value(section_model, key, value)
-
-        new_section = section_model.model_copy(update={key: parsed_value})
-        new_settings = settings.model_copy(update={section: new_section})
-
-        if validate:
-            new_settings = Settings.model_validate(new_settings.model_dump())
-
-        self.export_settings(new_settings, settings_file)
-        return new_settings
+        return self.update_settings(project_name, {f"{section}.{key}": value}, validate)
 
     def set_param(self, project_name: str, param: str, value, validate: bool = True):
         """
@@ -447,27 +641,24 @@ class SettingsManager:
 
         :param param: Parameter key in the format ``SECTION.KEY``.
         """
-        section, key = self._split_param(param)
-        return self.set_value(project_name, section, key, value, validate)
+        return self.update_settings(project_name, {param: value}, validate)
 
     def update_settings(self, project_name: str, updates: Dict[str, Any], validate: bool = True) -> Settings:
         """
         Apply multiple updates in one pass. Keys must be in ``SECTION.KEY`` format.
+
+        The settings file is read once, every update is applied, and the result is
+        validated and written once. Prefer this over calling :meth:`set_param` in a loop.
         """
         settings_file = self.get_settings_path(project_name)
-        settings: Settings = self.load_settings(project_name)
-        new_settings = settings
+        data = self._load_raw(project_name)
 
         for param, value in updates.items():
             section, key = self._split_param(param)
-            section_model = self._get_section_model(new_settings, section, key)
-            parsed_value = self._parse_value(section_model, key, value)
-            updated_section = section_model.model_copy(update={key: parsed_value})
-            new_settings = new_settings.model_copy(update={section: updated_section})
-
-        if validate:
-            new_settings = Settings.model_validate(new_settings.model_dump())
+            section_model = self._get_section_model(section, key)
+            data.setdefault(section, {})[key] = self._parse_value(section_model, key, value)
 
+        new_settings = self.load_from_dict(data, validate)
         self.export_settings(new_settings, settings_file)
         return new_settings
 
@@ -518,23 +709,15 @@ class SettingsManager:
         return settings
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _generate_settings_order() -> Dict[str, List[str]]:
         """
         Generate settings order dictionary rely on root_model definition. This inspects the Settings model and its
         submodels to extract field order.
-        """
 
-        def _unwrap_model_from_annotation(ann):
-            if ann is None:
-                return None
-            origin = get_origin(ann)
-            if origin is Union:
-                for a in get_args(ann):
-                    if isinstance(a, type) and issubclass(a, BaseModel):
-                        return a
-            if isinstance(ann, type) and issubclass(ann, BaseModel):
-                return ann
-            return None
+        The result only depends on the model definitions, so it is computed once and shared by every
+        :class:`SettingsManager` instance. Callers must treat it as read-only.
+        """
 
         order: Dict[str, List[str]] = {}
         annotations = getattr(Settings, "__annotations__", {})
@@ -566,6 +749,30 @@ class SettingsManager:
 
         return order
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _settings_order_rank() -> Dict[str, Dict[str, int]]:
+        """
+        Map every group of :meth:`_generate_settings_order` to a ``{key: position}`` lookup.
+
+        Used as a sort key when exporting, so ordering a group is a single sort instead of
+        a scan over ``SETTINGS_ORDER``.
+        """
+        return {
+            group: {key: index for index, key in enumerate(keys)}
+            for group, keys in SettingsManager._generate_settings_order().items()
+        }
+
+    @cached_property
+    def _default_template(self) -> Path:
+        """
+        Default settings template, generated once per manager and reused afterwards.
+
+        :return: Path to the generated template file.
+        :rtype: Path
+        """
+        return self._default_template_file()
+
     def _default_template_file(self) -> Path:
         """
         Create a temporary TOML file with default settings.
@@ -600,15 +807,8 @@ class SettingsManager:
 
             ann = getattr(field_info, "annotation", None)
             # detectar submodel directo
-            sub = None
+            sub = _unwrap_model_from_annotation(ann)
             origin = get_origin(ann)
-            if origin is Union:
-                for a in get_args(ann):
-                    if isinstance(a, type) and issubclass(a, BaseModel):
-                        sub = a
-                        break
-            elif isinstance(ann, type) and issubclass(ann, BaseModel):
-                sub = ann
 
             # lista de submodelos: List[SubModel] or list[SubModel]
             if origin in (list, list.__class__) or getattr(ann, "__origin__", None) in (list,):
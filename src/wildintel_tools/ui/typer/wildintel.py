@@ -1,17 +1,59 @@
+from __future__ import annotations
+
 import asyncio
 from asyncio import Runner
 from collections import defaultdict
 from pathlib import Path
-from typing import List, Iterable, Callable
+from typing import List, Iterable, Callable, TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn, TaskProgressColumn
-from trapper_client.TrapperClient import TrapperClient
-
+from wildintel_tools.progress import ImportEvent, ProgressCallback
 from wildintel_tools.reports import Report
-from wildintel_tools.resouceutils import ResourceExtensionDTO
+from wildintel_tools.resourcetypes import ResourceExtensionDTO
 from wildintel_tools.ui.typer.TyperUtils import TyperUtils
-import wildintel_tools.wildintel
+from wildintel_tools.ui.typer._progress import BufferedAdvance, ProgressDispatcher
+
+# Rich, the Trapper client and the core module are imported where they are used, so
+# loading the CLI does not pay for them until a command actually runs.
+if TYPE_CHECKING:
+    from trapper_client.TrapperClient import TrapperClient
+
+    from wildintel_tools.fswalk import FsIndex
+
+def _run_with_progress(
+    run: Callable[[ProgressCallback | None], Report],
+    show_progress: bool = True,
+    **dispatcher_options,
+) -> Report:
+    """
+    Run a collection operation with one Rich bar per collection and per deployment.
+
+    File progress is coalesced by :class:`ProgressDispatcher`, and Rich redraws at most
+    10 times per second, so the display costs the same however many files there are.
+    Pending advances are flushed even if the operation fails.
+
+    :param run: Runs the operation with the given progress callback.
+    :param show_progress: If False the operation runs without Rich at all: no live-render
+        thread and no callback per event.
+    :param dispatcher_options: Extra arguments for :class:`ProgressDispatcher`.
+    """
+    if not show_progress:
+        return run(None)
+
+    from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn
+
+    with Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        "[progress.percentage]{task.percentage:>3.0f}%",
+        TimeElapsedColumn(),
+        refresh_per_second=10,
+    ) as progress:
+        dispatcher = ProgressDispatcher(progress, **dispatcher_options)
+        try:
+            return run(dispatcher.on_event)
+        finally:
+            dispatcher.flush()
 
 def check_collections(
     data_path: Path,
@@ -23,52 +65,10 @@ def check_collections(
     max_workers: int = 4,
     show_progress: bool = True,
 ) -> Report:
+    import wildintel_tools.wildintel
 
-    with Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(),
-        "[progress.percentage]{task.percentage:>3.0f}%",
-        TimeElapsedColumn(),
-    ) as progress:
-        collection_tasks = {}
-
-        # Callback que la función llamará
-        def on_progress(event: str, count: int):
-            """
-            Progress callback used to render nested progress bars.
-
-            The event string indicates the stage:
-            ``collection_start:<COLLECTION>``, ``deployment_start:<COLLECTION>:<DEPLOYMENT>:<TOTAL>``,
-            ``file_progress:<COLLECTION>:<DEPLOYMENT>``.
-
-            :param event: Event identifier with context tokens.
-            :type event: str
-            :param count: Amount of progress to advance.
-            :type count: int
-            :returns: None
-            """
-            nonlocal collection_tasks
-            if event.startswith("collection_start:"):
-                _, col_name = event.split(":", 1)
-                collection_tasks[col_name] = {
-                    "task_collection": progress.add_task(f"Collection {col_name}", total=count),
-                    "deployments": {}
-                }
-            elif event.startswith("deployment_start:"):
-                _, col_name, dep_name = event.split(":", 2)
-                collection_tasks[col_name]["deployments"][dep_name] = progress.add_task(
-                    f"  Deployment {dep_name}", total=count
-                )
-            elif event.startswith("file_progress:"):
-                _, col_name, dep_name, filename = event.split(":", 3)
-                task_dep = collection_tasks[col_name]["deployments"][dep_name]
-                progress.advance(task_dep, count)
-                progress.advance(collection_tasks[col_name]["task_collection"], count)
-            elif event.startswith("deployment_complete:"):
-                _,col_name, dep_name = event.split(":", 2)
-                progress.advance(collection_tasks[col_name]["task_collection"], 1)
-
-        report = wildintel_tools.wildintel.check_collections(
+    def _run(progress_callback):
+        return wildintel_tools.wildintel.check_collections(
                 data_path=Path(data_path),
                 collections=collections,
                 url = url,
@@ -76,10 +76,10 @@ def check_collections(
                 password = password,
                 validate_locations = validate_locations,
                 max_workers=max_workers,
-                progress_callback=on_progress if show_progress else None,
+                progress_callback=progress_callback,
         )
 
-    return report
+    return _run_with_progress(_run, show_progress, advance_collection_per_unit=True)
 
 def check_deployments(
         data_path: Path,
@@ -89,58 +89,23 @@ def check_deployments(
         tolerance_hours: int = 1,
         max_workers:int =4,
         show_progress: bool = True,
+        fs_index: FsIndex | None = None,
 ) -> Report:
-    with Progress(
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(),
-            "[progress.percentage]{task.percentage:>3.0f}%",
-            TimeElapsedColumn(),
-    ) as progress:
+    import wildintel_tools.wildintel
 
-        # Mapa para almacenar tareas de colecciones y deployments
-        collection_tasks = {}
-
-        # Callback que la función llamará
-        def on_progress(event: str, count: int):
-            """
-            Progress callback used to render nested progress bars.
-
-            Event forms:
-            ``collection_start:<COLLECTION>``, ``deployment_start:<COLLECTION>:<DEPLOYMENT>:<TOTAL>``,
-            ``file_progress:<COLLECTION>:<DEPLOYMENT>``, ``deployment_complete:<COLLECTION>:<DEPLOYMENT>``.
-            """
-            nonlocal collection_tasks
-            if event.startswith("collection_start:"):
-                _, col_name = event.split(":", 1)
-                if col_name not in collection_tasks:
-                    collection_tasks[col_name] = {
-                        "task_collection": progress.add_task(f"Collection {col_name}", total=count),
-                        "deployments": {}
-                    }
-            elif event.startswith("deployment_start:"):
-                _, col_name, dep_name = event.split(":", 2)
-                collection_tasks[col_name]["deployments"][dep_name] = progress.add_task(
-                    f"  Deployment {dep_name}", total=count
-                )
-            elif event.startswith("file_progress:"):
-                _, col_name, dep_name, file_name = event.split(":", 3)
-                task_dep = collection_tasks[col_name]["deployments"][dep_name]
-                progress.advance(task_dep, count)
-            elif event.startswith("deployment_complete:"):
-                _, col_name, dep_name = event.split(":", 2)
-                progress.advance(collection_tasks[col_name]["task_collection"], 1)
-
-        report = wildintel_tools.wildintel.check_deployments(
+    def _run(progress_callback):
+        return wildintel_tools.wildintel.check_deployments(
             data_path=Path(data_path),
             collections=collections,
             extensions=extensions,
-            progress_callback=on_progress if show_progress else None,
+            progress_callback=progress_callback,
             max_workers=max_workers,
             tolerance_hours=tolerance_hours,
-            deployments=deployments
+            deployments=deployments,
+            fs_index=fs_index,
         )
 
-    return report
+    return _run_with_progress(_run, show_progress)
 
 def prepare_collections_for_trapper(
     data_path: Path,
@@ -157,53 +122,18 @@ def prepare_collections_for_trapper(
     ignore_dst=True,
     convert_to_utc= True,
     show_progress: bool = True,
-
+    fs_index: FsIndex | None = None,
 ) -> Report:
-    with Progress(
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(),
-            "[progress.percentage]{task.percentage:>3.0f}%",
-            TimeElapsedColumn(),
-    ) as progress:
-
-        # Mapa para almacenar tareas de colecciones y deployments
-        collection_tasks = {}
-
-        def on_progress(event: str, count: int):
-            """
-            Progress callback used to render nested progress bars.
-
-            Event forms:
-            ``collection_start:<COLLECTION>``, ``deployment_start:<COLLECTION>:<DEPLOYMENT>:<TOTAL>``,
-            ``file_progress:<COLLECTION>:<DEPLOYMENT>``, ``deployment_complete:<COLLECTION>:<DEPLOYMENT>``.
-            """
-            nonlocal collection_tasks
-            if event.startswith("collection_start:"):
-                _, col_name = event.split(":", 1)
-                collection_tasks[col_name] = {
-                    "task_collection": progress.add_task(f"Collection {col_name}", total=count),
-                    "deployments": {}
-                }
-            elif event.startswith("deployment_start:"):
-                _, col_name, dep_name = event.split(":", 2)
-                collection_tasks[col_name]["deployments"][dep_name] = progress.add_task(
-                    f"  Deployment {dep_name}", total=count
-                )
-            elif event.startswith("file_progress:"):
-                _, col_name, dep_name, file_name = event.split(":", 3)
-                task_dep = collection_tasks[col_name]["deployments"][dep_name]
-                progress.advance(task_dep, count)
-            elif event.startswith("deployment_complete:"):
-                _, col_name, dep_name = event.split(":", 2)
-                progress.advance(collection_tasks[col_name]["task_collection"], 1)
+    import wildintel_tools.wildintel
 
+    def _run(progress_callback):
         return wildintel_tools.wildintel.prepare_collections_for_trapper(
                 data_path=data_path,
                 output_dir=output_dir,
                 collections=collections,
                 deployments=deployments,
                 extensions=extensions,
-                progress_callback=on_progress if show_progress else None,
+                progress_callback=progress_callback,
                 max_workers=max_workers,
                 xmp_info=xmp_info,
                 scale_images=scale_images,
@@ -211,9 +141,12 @@ def prepare_collections_for_trapper(
                 create_deployment_table=create_deployment_table,
                 timezone=timezone,
                 ignore_dst=ignore_dst,
-                convert_to_utc=convert_to_utc
+                convert_to_utc=convert_to_utc,
+                fs_index=fs_index,
         )
 
+    return _run_with_progress(_run, show_progress)
+
 def create_trapper_package(
     data_path : Path,
     output_path: Path,
@@ -227,44 +160,10 @@ def create_trapper_package(
     max_workers:  int = 4,
     max_zip_size: int = 500,
 ):
-    with Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(),
-        "[progress.percentage]{task.percentage:>3.0f}%",
-        TimeElapsedColumn(),
-    ) as progress:
-        # Mapa para almacenar tareas de colecciones y deployments
-        collection_tasks = {}
-
-        def on_progress(event: str, count: int):
-            """
-            Progress callback used to render nested progress bars.
-
-            Event forms:
-            ``collection_start:<COLLECTION>``, ``deployment_start:<COLLECTION>:<DEPLOYMENT>:<TOTAL>``,
-            ``file_progress:<COLLECTION>:<DEPLOYMENT>``, ``deployment_complete:<COLLECTION>:<DEPLOYMENT>``.
-            """
-            nonlocal collection_tasks
-            if event.startswith("collection_start:"):
-                _, col_name = event.split(":", 1)
-                collection_tasks[col_name] = {
-                    "task_collection": progress.add_task(f"Collection {col_name}", total=count),
-                    "deployments": {},
-                }
-            elif event.startswith("deployment_start:"):
-                _, col_name, dep_name = event.split(":", 2)
-                collection_tasks[col_name]["deployments"][dep_name] = progress.add_task(
-                    f"  Deployment {dep_name}", total=count
-                )
-            elif event.startswith("file_progress:"):
-                _, col_name, dep_name, file_name = event.split(":", 3)
-                task_dep = collection_tasks[col_name]["deployments"][dep_name]
-                progress.advance(task_dep, count)
-            elif event.startswith("deployment_complete:"):
-                _, col_name, dep_name = event.split(":", 2)
-                progress.advance(collection_tasks[col_name]["task_collection"], 1)
-
-        report = wildintel_tools.wildintel.create_trapper_package(
+    import wildintel_tools.wildintel
+
+    def _run(progress_callback):
+        return wildintel_tools.wildintel.create_trapper_package(
             data_path,
             output_path,
             collections,
@@ -276,9 +175,9 @@ def create_trapper_package(
             ignore_dst,
             max_workers,
             max_zip_size,
-            on_progress)
-        # report = dpg.run(max_workers = 4, progress_callback=on_progress)
-        return report
+            progress_callback)
+
+    return _run_with_progress(_run)
 
 def upload_trapper_package(
         output_path: Path,
@@ -287,17 +186,12 @@ def upload_trapper_package(
         trapper_client: TrapperClient = None,
         trigger: bool = True,
         remove_zip: bool = True,
+        max_concurrency: int = 8,
 ):
     TyperUtils.debug(f"Uploading collections {','.join([c for c in collections])} to Trapper")
 
-    from rich.progress import (
-        Progress,
-        TextColumn,
-        BarColumn,
-        TimeElapsedColumn,
-    )
-
-    collection_tasks = {}
+    import wildintel_tools.wildintel
+    from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn, TaskProgressColumn
 
     progress = Progress(
         TextColumn("[bold blue]{task.description}"),
@@ -307,35 +201,9 @@ def upload_trapper_package(
         TimeElapsedColumn(),
     )
 
-    def callback(event: str, count: int):
-        if event.startswith("collection_start:"):
-            _, col = event.split(":", 1)
-            collection_tasks[col] = {
-                "collection": progress.add_task(
-                    f"Collection {col}", total=count
-                ),
-                "deployments": {},
-            }
-
-        elif event.startswith("deployment_start:"):
-            _, col, dep = event.split(":", 2)
-            task = progress.add_task(
-                f"  Deployment {dep}", total=count
-            )
-            collection_tasks[col]["deployments"][dep] = task
-
-        elif event.startswith("file_progress:"):
-            _, col, dep = event.split(":", 2)
-            progress.advance(
-                collection_tasks[col]["deployments"][dep],
-                count,
-            )
-
-        elif event.startswith("deployment_complete:"):
-            _, col, dep = event.split(":", 2)
-            progress.advance(
-                collection_tasks[col]["collection"], 1
-            )
+    # Upload progress is counted in bytes, so only the time-based flush applies.
+    # Called from the event loop thread only; the concurrent uploads share it
+    callback = ProgressDispatcher(progress, max_pending=None).on_event
 
     with progress:
         with Runner() as runner:
@@ -348,6 +216,7 @@ def upload_trapper_package(
                     trigger=trigger,
                     remove_zip=remove_zip,
                     progress_callback=callback,
+                    max_concurrency=max_concurrency,
                 )
             )
 
@@ -371,6 +240,9 @@ def import_deployment(
               ``exif`` and ``csv_log``. The ``csv_log`` success entry carries
               ``start_dt``, ``end_dt``, ``copied_files`` and ``copied_dirs`` as extras.
     """
+    import wildintel_tools.wildintel
+    from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn, TaskProgressColumn
+
     copy_task_id = None
     exif_task_id = None
 
@@ -381,33 +253,40 @@ def import_deployment(
         TimeElapsedColumn(),
     ) as progress:
 
-        def on_progress(event: str, count: int) -> None:
-            nonlocal copy_task_id, exif_task_id
+        add_task = progress.add_task
+        # Per-file events are coalesced instead of redrawing on every file
+        buffered = BufferedAdvance(progress)
+        advance = buffered.add
 
-            if event.startswith("copy_start:"):
-                total = int(event.split(":", 1)[1])
-                copy_task_id = progress.add_task("[cyan]Copying files…", total=total)
+        def on_progress(event: ImportEvent, filename: str | None, count: int) -> None:
+            nonlocal copy_task_id, exif_task_id
 
-            elif event.startswith("copy_file:"):
+            if event == ImportEvent.COPY_FILE:
                 if copy_task_id is not None:
-                    progress.advance(copy_task_id, 1)
+                    advance(copy_task_id, count)
 
-            elif event.startswith("exif_start:"):
-                total = int(event.split(":", 1)[1])
-                exif_task_id = progress.add_task("[yellow]Reading timestamps…", total=total)
-
-            elif event.startswith("exif_file:") or event.startswith("exif_skip:"):
+            elif event == ImportEvent.EXIF_FILE or event == ImportEvent.EXIF_SKIP:
                 if exif_task_id is not None:
-                    progress.advance(exif_task_id, 1)
-
-        result = wildintel_tools.wildintel.import_deployment(
-            source_dir=source_dir,
-            destination_dir=destination_dir,
-            deployment_name=deployment_name,
-            log_file=log_file,
-            timezone=timezone,
-            ignore_dst=ignore_dst,
-            progress_callback=on_progress,
-        )
+                    advance(exif_task_id, count)
+
+            elif event == ImportEvent.COPY_START:
+                copy_task_id = add_task("[cyan]Copying files…", total=count)
+
+            elif event == ImportEvent.EXIF_START:
+                buffered.flush()
+                exif_task_id = add_task("[yellow]Reading timestamps…", total=count)
+
+        try:
+            result = wildintel_tools.wildintel.import_deployment(
+                source_dir=source_dir,
+                destination_dir=destination_dir,
+                deployment_name=deployment_name,
+                log_file=log_file,
+                timezone=timezone,
+                ignore_dst=ignore_dst,
+                progress_callback=on_progress,
+            )
+        finally:
+            buffered.flush()
 
     return result
@@ -1,20 +1,33 @@
 #!/usr/bin/env python3
 """
 CLI helper for building Sphinx documentation using uv environments.
+
+Sphinx runs inside this process; pass --isolated to run it with "uv run" instead.
 Usage examples:
   uv run python scripts/docs.py apidoc
   uv run python scripts/docs.py build
+  uv run python scripts/docs.py --isolated build
   uv run python scripts/docs.py serve
 """
 
 import argparse
+import http.server
+import os
+import shutil
 import subprocess
 import sys
+from functools import partial
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 DOCS = ROOT / "docs"
 SRC = ROOT / "src"
+# Same layout as "make html" in docs/: the pickled environment is kept out of the
+# HTML output so that cleaning the output keeps incremental builds
+BUILD = DOCS / "build"
+HTML = BUILD / "html"
+DOCTREES = BUILD / "doctrees"
+API = DOCS / "source" / "api"
 
 
 def run_command(cmd: list[str], description: str):
@@ -26,35 +39,97 @@ def run_command(cmd: list[str], description: str):
     print(f"✅ Done: {description}")
 
 
-def apidoc():
-    """Generate Sphinx API documentation from the Python source."""
-    run_command(
-        ["uv", "run", "sphinx-apidoc", "-o", str(DOCS / "source" / "api"), str(SRC)],
+def run_tool(tool: str, args: list[str], description: str, isolated: bool = False):
+    """
+    Run a Sphinx command line tool ("sphinx-build" or "sphinx-apidoc") in this process.
+
+    With ``isolated``, or if Sphinx cannot be imported here, it runs with "uv run" instead,
+    which resolves the environment again and starts a new interpreter.
+    """
+    if not isolated:
+        try:
+            if tool == "sphinx-build":
+                from sphinx.cmd.build import main as tool_main
+            else:
+                from sphinx.ext.apidoc import main as tool_main
+        except ImportError:
+            print(f"⚠️ Sphinx is not installed in this environment, running {tool} with uv")
+        else:
+            print(f"\n📘 {description}...")
+            returncode = tool_main(args)
+            if returncode:
+                print(f"❌ Error: {description} failed with code {returncode}")
+                sys.exit(returncode)
+            print(f"✅ Done: {description}")
+            return
+
+    run_command(["uv", "run", tool, *args], description)
+
+
+def apidoc(isolated: bool = False, force: bool = False):
+    """
+    Generate Sphinx API documentation from the Python source.
+
+    sphinx-apidoc runs without -f, so it only writes the files of new modules: its output
+    depends on which modules exist, not on their contents. Adding, removing or renaming a
+    module changes the mtime of its directory, so the run is skipped unless a source
+    directory is newer than the last run (or with ``force``).
+    """
+    stamp = API / "modules.rst"
+    if not force and stamp.exists() and stamp.stat().st_mtime >= _latest_dir_mtime(SRC):
+        print("✅ API documentation is up to date")
+        return
+
+    run_tool(
+        "sphinx-apidoc",
+        ["-o", str(API), str(SRC)],
         "Generating API documentation",
+        isolated,
     )
-
-
-def build():
-    """Build HTML documentation using Sphinx."""
-    run_command(
-        ["uv", "run", "sphinx-build", "-b", "html", str(DOCS / "source"), str(DOCS / "build")],
+    # Existing files are not rewritten, so record the run on modules.rst
+    stamp.touch()
+
+
+def _latest_dir_mtime(root: Path) -> float:
+    """Latest modification time of *root* and the directories under it."""
+    latest = root.stat().st_mtime
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith((".", "__pycache__")):
+                    latest = max(latest, entry.stat().st_mtime)
+                    stack.append(entry.path)
+    return latest
+
+
+def build(jobs: str = "auto", isolated: bool = False):
+    """Build HTML documentation using Sphinx, reading and writing documents in parallel."""
+    run_tool(
+        "sphinx-build",
+        ["-j", jobs, "-b", "html", "-d", str(DOCTREES), str(DOCS / "source"), str(HTML)],
         "Building HTML documentation",
+        isolated,
     )
 
 
 def serve(port: int):
     """Serve the generated documentation locally."""
     print(f"🌐 Serving docs at http://127.0.0.1:{port}")
-    subprocess.run(
-        ["uv", "run", "python", "-m", "http.server", "--directory", str(DOCS / "build"), str(port)]
-    )
-
-
-def clean():
-    """Clean the build directory."""
-    if (DOCS / "build").exists():
-        print("🧹 Cleaning build directory...")
-        subprocess.run(["rm", "-rf", str(DOCS / "build")])
+    handler = partial(http.server.SimpleHTTPRequestHandler, directory=str(HTML))
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def clean(all: bool = False):
+    """Clean the HTML output, or the whole build directory (including the Sphinx environment) with ``all``."""
+    target = BUILD if all else HTML
+    if target.exists():
+        print(f"🧹 Cleaning {target}...")
+        shutil.rmtree(target, ignore_errors=True)
     else:
         print("No build directory found.")
 
@@ -63,31 +138,47 @@ def main():
     parser = argparse.ArgumentParser(
         description="Manage Sphinx documentation tasks inside uv environments."
     )
+    parser.add_argument(
+        "--isolated", action="store_true",
+        help="Run Sphinx with 'uv run' in a separate process instead of in this one.",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Subcommand: apidoc
-    subparsers.add_parser("apidoc", help="Generate API documentation from source files.")
+    apidoc_parser = subparsers.add_parser("apidoc", help="Generate API documentation from source files.")
+    apidoc_parser.add_argument(
+        "--force", "-f", action="store_true",
+        help="Run sphinx-apidoc even if no module was added or removed since the last run.",
+    )
 
     # Subcommand: build
-    subparsers.add_parser("build", help="Build HTML documentation with Sphinx.")
+    build_parser = subparsers.add_parser("build", help="Build HTML documentation with Sphinx.")
+    build_parser.add_argument(
+        "--jobs", "-j", default="auto",
+        help="Number of parallel Sphinx processes, or 'auto' for one per CPU.",
+    )
 
     # Subcommand: serve
     serve_parser = subparsers.add_parser("serve", help="Serve the built documentation locally.")
     serve_parser.add_argument("--port", type=int, default=8000, help="Port to serve docs on.")
 
     # Subcommand: clean
-    subparsers.add_parser("clean", help="Remove generated documentation files.")
+    clean_parser = subparsers.add_parser("clean", help="Remove generated documentation files.")
+    clean_parser.add_argument(
+        "--all", action="store_true",
+        help="Also remove the Sphinx environment, forcing a full rebuild.",
+    )
 
     args = parser.parse_args()
 
     if args.command == "apidoc":
-        apidoc()
+        apidoc(args.isolated, args.force)
     elif args.command == "build":
-        build()
+        build(args.jobs, args.isolated)
     elif args.command == "serve":
         serve(args.port)
     elif args.command == "clean":
-        clean()
+        clean(args.all)
 
 
 if __name__ == "__main__":
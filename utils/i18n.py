@@ -1,29 +1,112 @@
-import subprocess
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-LOCALES_ROOT = Path(__file__).resolve().parent.parent / "src" / "wildintel_tools" / "locales"
+from babel.messages.catalog import Catalog
+from babel.messages.extract import DEFAULT_KEYWORDS, check_and_call_extract_file
+from babel.messages.frontend import CommandLineInterface, parse_mapping_cfg
+from babel.messages.mofile import write_mo
+from babel.messages.pofile import read_po, write_po
+from babel.util import pathmatch
 
-def extract_translations():
+ROOT = Path(__file__).resolve().parent.parent
+LOCALES_ROOT = ROOT / "src" / "wildintel_tools" / "locales"
+
+def extract_translations(force=False):
     """
     Genera el archivo POT a partir de las cadenas marcadas en el proyecto.
+
+    Usa la API de Babel en el mismo proceso, con el mismo resultado que
+    ``pybabel extract -F babel.cfg -o <pot> .`` ejecutado en la raíz del proyecto.
+    Si el POT es más reciente que ``babel.cfg`` y que todos los archivos de los que
+    se extraen mensajes no se vuelve a generar, salvo con ``force``.
     """
     pot_path = LOCALES_ROOT / "messages.pot"
-    subprocess.run([
-        "pybabel",
-        "extract",
-        "-F", "babel.cfg",
-        "-o", str(pot_path),
-        "."
-    ], check=True)
+
+    with open(ROOT / "babel.cfg", encoding="utf-8") as f:
+        method_map, options_map = parse_mapping_cfg(f, filename="babel.cfg")
+
+    files = _source_files()
+    if not force and _is_pot_up_to_date(pot_path, files, method_map):
+        print(f"✅ El archivo POT ya está actualizado en {pot_path}")
+        return
+
+    # Cada archivo se extrae en un proceso del pool; los mensajes se añaden en el
+    # mismo orden en que los recorre pybabel, así que el POT no cambia
+    extract = partial(_extract_file, method_map=method_map, options_map=options_map)
+    catalog = Catalog(charset="utf-8")
+    with ProcessPoolExecutor() as executor:
+        for messages in executor.map(extract, files, chunksize=16):
+            for filename, lineno, message, comments, context in messages:
+                catalog.add(message, None, [(filename.replace(os.sep, "/"), lineno)],
+                            auto_comments=comments, context=context)
+
+    with open(pot_path, "wb") as f:
+        write_po(f, catalog, width=76)
     print(f"✅ Archivo POT generado en {pot_path}")
 
 
+def _source_files() -> list[str]:
+    """
+    Archivos del proyecto en el orden de ``extract_from_dir``, sin los directorios
+    que empiezan por ``.`` o ``_``.
+    """
+    files = []
+    for root, dirnames, filenames in os.walk(ROOT):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "_")))
+        files.extend(os.path.join(root, filename).replace(os.sep, "/") for filename in sorted(filenames))
+    return files
+
+
+def _is_pot_up_to_date(pot_path: Path, files: list[str], method_map) -> bool:
+    """
+    Indica si el POT existe y es más reciente que ``babel.cfg`` y que los archivos
+    de los que se extraen mensajes.
+    """
+    try:
+        pot_mtime = pot_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+    if (ROOT / "babel.cfg").stat().st_mtime > pot_mtime:
+        return False
+    for filepath in files:
+        if _is_extracted(os.path.relpath(filepath, ROOT).replace(os.sep, "/"), method_map) \
+                and os.stat(filepath).st_mtime > pot_mtime:
+            return False
+    return True
+
+
+def _is_extracted(filename: str, method_map) -> bool:
+    """
+    Indica si ``check_and_call_extract_file`` extrae mensajes de un archivo: el
+    primer patrón de ``babel.cfg`` que coincide decide, y ``ignore`` lo descarta.
+    """
+    for pattern, method in method_map:
+        if pathmatch(pattern, filename):
+            return method != "ignore"
+    return False
+
+
+def _extract_file(filepath: str, method_map, options_map) -> list:
+    """
+    Extrae los mensajes de un archivo si coincide con algún patrón de ``babel.cfg``.
+    """
+    return list(check_and_call_extract_file(
+        filepath, method_map, options_map, callback=None, keywords=DEFAULT_KEYWORDS,
+        comment_tags=(), strip_comment_tags=False, dirpath=str(ROOT),
+    ))
+
+
 def init_translation(lang="en_GB"):
     """
     Genera el archivo PO para el idioma especificado a partir del POT.
     Si el PO ya existe, actualiza su contenido.
+
+    Ejecuta ``pybabel init`` o ``pybabel update`` en el mismo proceso, sin lanzar
+    un intérprete nuevo.
     """
     po_dir = LOCALES_ROOT / lang / "LC_MESSAGES"
     po_file = po_dir / "messages.po"
@@ -34,36 +117,92 @@ def init_translation(lang="en_GB"):
 
     if not os.path.exists(po_file):
         # Inicializar archivo PO si no existe
-        subprocess.run([
+        CommandLineInterface().run([
             "pybabel",
             "init",
             "-i", str(pot_path),
             "-d", str(LOCALES_ROOT),
             "-l", lang
-        ], check=True)
+        ])
         print(f"✅ Archivo PO creado para idioma '{lang}' en {po_file}")
     else:
         # Actualizar PO existente
-        subprocess.run([
+        CommandLineInterface().run([
             "pybabel",
             "update",
             "-i", str(pot_path),
             "-d", str(LOCALES_ROOT),
             "-l", lang
-        ], check=True)
+        ])
         print(f"🔄 Archivo PO actualizado para idioma '{lang}' en {po_file}")
 
 
-def compile_translations():
+def init_translations(langs):
+    """
+    Genera o actualiza los archivos PO de varios idiomas a partir del POT.
+
+    Cada idioma es independiente, así que se procesan en paralelo. Si alguno falla
+    se propaga su error.
+    """
+    with ProcessPoolExecutor(max_workers=min(len(langs), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(init_translation, lang) for lang in langs]
+        for future in futures:
+            future.result()
+
+
+def compile_translations(force=False):
     """
     Compila todos los archivos PO a MO para que Python pueda usarlos.
+
+    Usa la API de Babel en el mismo proceso; como ``pybabel compile``, los
+    catálogos marcados como fuzzy no se compilan. Los PO cuyo MO es más reciente
+    que ellos no se vuelven a compilar, salvo con ``force``.
+    """
+    po_files = sorted(LOCALES_ROOT.glob("*/LC_MESSAGES/*.po"))
+    if not force:
+        po_files = [po_file for po_file in po_files if not _is_up_to_date(po_file)]
+
+    if not po_files:
+        print(f"✅ Los archivos MO ya están actualizados en {LOCALES_ROOT}")
+        return
+
+    # Cada idioma es independiente, así que se compilan en paralelo
+    with ProcessPoolExecutor(max_workers=min(len(po_files), os.cpu_count() or 1)) as executor:
+        list(executor.map(compile_translation, po_files))
+    print(f"✅ {len(po_files)} archivos PO han sido compilados a MO en {LOCALES_ROOT}")
+
+
+def _is_up_to_date(po_file: Path) -> bool:
+    """
+    Indica si el MO de un PO existe y es más reciente que él.
     """
-    subprocess.run([
-        "pybabel",
-        "compile",
-        "-d", str(LOCALES_ROOT)
-    ], check=True)
-    print(f"✅ Todos los archivos PO han sido compilados a MO en {LOCALES_ROOT}")
+    # El MO solo depende del PO: un POT nuevo no cambia nada hasta que se actualiza el PO
+    try:
+        return po_file.with_suffix(".mo").stat().st_mtime >= po_file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def compile_translation(po_file: Path) -> bool:
+    """
+    Compila un archivo PO al archivo MO que tiene al lado.
+
+    :return: ``False`` si el catálogo está marcado como fuzzy y no se ha compilado.
+    """
+    with open(po_file, "rb") as f:
+        catalog = read_po(f, locale=po_file.parent.parent.name)
+
+    if catalog.fuzzy:
+        print(f"⚠️ {po_file} está marcado como fuzzy, no se compila")
+        return False
+
+    for message, errors in catalog.check():
+        for error in errors:
+            print(f"⚠️ {po_file}: error en '{message.id}': {error}")
+
+    with open(po_file.with_suffix(".mo"), "wb") as f:
+        write_mo(f, catalog)
+    return True
 
 
 def main():
@@ -80,18 +219,26 @@ def main():
     parser.add_argument(
         "--lang",
         "-l",
-        default="en",
-        help="Idioma a inicializar o actualizar (solo necesario con 'po')."
+        nargs="+",
+        default=["en"],
+        help="Idiomas a inicializar o actualizar (solo necesario con 'po')."
+    )
+
+    parser.add_argument(
+        "--force",
+        "-f",
+        action="store_true",
+        help="Regenera el POT o compila todos los PO aunque ya estén actualizados (solo con 'pot' y 'mo')."
     )
 
     args = parser.parse_args()
 
     if args.action == "pot":
-        extract_translations()
+        extract_translations(args.force)
     elif args.action == "po":
-        init_translation(args.lang)
+        init_translations(args.lang)
     elif args.action == "mo":
-        compile_translations()
+        compile_translations(args.force)
 
 
 if __name__ == "__main__":